@@ -33,6 +33,21 @@ KNOWN = {
     0x77: "BME280/BMP280 (alt)",
 }
 
+# Only the known addresses are probed; a full i2c.scan() addresses all 112
+# valid 7-bit addresses and can upset unrelated devices.
+PROBE_ADDRS = list(KNOWN.keys())
+
+# Give up on a pin pair after this long (e.g. SDA shorted low).
+PAIR_TIMEOUT_MS = 500
+
+def _probe(i2c, addr):
+    """Return True if a device ACKs a zero-length write at addr."""
+    try:
+        i2c.writeto(addr, b"")
+        return True
+    except OSError:
+        return False
+
 
 def main():
     print("=" * 60)
@@ -49,7 +64,15 @@ def main():
         try:
             i2c = I2C(0, scl=Pin(scl_pin), sda=Pin(sda_pin), freq=100000)
             time.sleep(0.02)
-            devices = i2c.scan()
+            devices = []
+            timed_out = False
+            deadline = time.ticks_add(time.ticks_ms(), PAIR_TIMEOUT_MS)
+            for addr in PROBE_ADDRS:
+                if time.ticks_diff(deadline, time.ticks_ms()) < 0:
+                    timed_out = True
+                    break
+                if _probe(i2c, addr):
+                    devices.append(addr)
             if devices:
                 print(f"✓ Found {len(devices)} device(s):")
                 for addr in devices:
@@ -57,6 +80,8 @@ def main():
                     print(f"  • {hex(addr)} ({addr}) - {name}")
                 print("\nStop here: use this pin pair in your code.")
                 return
+            elif timed_out:
+                print(f"✗ timeout after {PAIR_TIMEOUT_MS}ms on this pair, skipping.")
             else:
                 print("✗ No devices found on this pair.")
         except Exception as e:
@@ -6,7 +6,14 @@ Helps debug accelerometer connection issues.
 """
 
 from machine import Pin, I2C
+from micropython import const
 import time
+import os
+
+try:
+    import ujson as json
+except ImportError:
+    import json
 
 # Optional: toggle IMU reset if wired. Safe if not connected.
 try:
@@ -20,15 +27,91 @@ try:
 except Exception:
     IMU_ADDRESS_SELECT_PIN = None
 
+# I2C pins from hardware.py (Pixiboo external IMU header)
+SCL_PIN = const(15)
+SDA_PIN = const(16)
+
+KNOWN = {
+    0x28: "BNO055 (9-axis IMU)",
+    0x29: "BNO055 (alt address)",
+    0x68: "MPU6050/MPU9250",
+    0x69: "MPU6050 (alt address)",
+    0x6A: "LSM6DS3",
+    0x76: "BME280/BMP280",
+    0x77: "BME280/BMP280 (alt)",
+}
+
+# Only the known addresses are probed; a full i2c.scan() addresses all 112
+# valid 7-bit addresses and can upset unrelated devices.
+PROBE_ADDRS = list(KNOWN.keys())
+
+# Last config that found a device; tried first on the next run.
+CACHE_FILE = "/i2c_cache.json"
+
+# Pin objects by GPIO number, shared by every I2C config that uses them
+_PIN_CACHE = {}
+
+
+def _get_pin(num):
+    pin = _PIN_CACHE.get(num)
+    if pin is None:
+        pin = Pin(num)
+        _PIN_CACHE[num] = pin
+    return pin
+
+
+def _get_i2c(i2c_id, freq, scl=SCL_PIN, sda=SDA_PIN):
+    """Return the I2C bus configured for this id, pins and frequency."""
+    # Constructed every time: on ESP32 each bus id is a single shared
+    # object, so a cached instance would run at whatever frequency the
+    # last construction set
+    return I2C(i2c_id, scl=_get_pin(scl), sda=_get_pin(sda), freq=freq)
+
+
+def _probe(i2c, addr):
+    """Return True if a device ACKs a zero-length write at addr."""
+    try:
+        i2c.writeto(addr, b"")
+        return True
+    except OSError:
+        return False
+
+
+def _load_cached_config():
+    """Return the last working config from CACHE_FILE, or None."""
+    try:
+        with open(CACHE_FILE) as f:
+            cached = json.load(f)
+        cached["name"] = f"I2C{cached['id']} @ {cached['freq'] // 1000}kHz (cached)"
+        return cached
+    except Exception:
+        return None
+
+
+def _save_cached_config(config):
+    try:
+        with open(CACHE_FILE, "w") as f:
+            json.dump({
+                "id": config["id"],
+                "freq": config["freq"],
+                "sda": config.get("sda", SDA_PIN),
+                "scl": config.get("scl", SCL_PIN),
+            }, f)
+    except Exception as e:
+        print(f"(Could not save {CACHE_FILE}: {e})")
+
+
+def _forget_cached_config():
+    try:
+        os.remove(CACHE_FILE)
+    except OSError:
+        pass
+
 def scan_i2c():
     """Scan I2C bus and display found devices."""
     print("=" * 60)
     print("Pixiboo I2C Scanner")
     print("=" * 60)
-    
-    # I2C pins from hardware.py (Pixiboo external IMU header)
-    SCL_PIN = 15
-    SDA_PIN = 16
 
     # Give the BNO055 time to boot after power/reset
     print("\nBoot delay: waiting 1.0s for IMU to power up...")
@@ -62,12 +145,24 @@ def scan_i2c():
     print(f"  Frequency: 400kHz")
     
     # Try different I2C configurations
-    # Start with 100kHz since brute-force scanner confirmed that works
+    # Start with 100kHz since brute-force scanner confirmed that works,
+    # and stop at the first config that finds a device.
     configs = [
         {"id": 0, "freq": 100000, "name": "I2C0 @ 100kHz"},
         {"id": 0, "freq": 400000, "name": "I2C0 @ 400kHz"},
         {"id": 1, "freq": 100000, "name": "I2C1 @ 100kHz"},
     ]
+
+    # A config that worked last time goes first
+    cached = _load_cached_config()
+    if cached is not None:
+        # Drop its default twin so a failing cached config isn't retried
+        configs = [
+            c for c in configs
+            if (c["id"], c["freq"], c.get("scl", SCL_PIN), c.get("sda", SDA_PIN))
+            != (cached["id"], cached["freq"], cached.get("scl", SCL_PIN), cached.get("sda", SDA_PIN))
+        ]
+        configs.insert(0, cached)
     
     for config in configs:
         print(f"\n{'─' * 60}")
@@ -75,19 +170,31 @@ def scan_i2c():
         print(f"{'─' * 60}")
         
         try:
-            i2c = I2C(config['id'], scl=Pin(SCL_PIN), sda=Pin(SDA_PIN), freq=config['freq'])
-            devices = i2c.scan()
+            i2c = _get_i2c(
+                config['id'],
+                config['freq'],
+                scl=config.get('scl', SCL_PIN),
+                sda=config.get('sda', SDA_PIN),
+            )
+            devices = [a for a in PROBE_ADDRS if _probe(i2c, a)]
             
             if devices:
                 print(f"✓ Found {len(devices)} device(s):")
                 for addr in devices:
                     device_name = get_device_name(addr)
                     print(f"  • Address: {hex(addr)} ({addr}) - {device_name}")
+                if config is not cached:
+                    _save_cached_config(config)
+                break
             else:
                 print("✗ No devices found")
                 
         except Exception as e:
             print(f"✗ Error: {e}")
+
+        # The cached config no longer works; don't try it first next time
+        if config is cached:
+            _forget_cached_config()
     
     print(f"\n{'=' * 60}")
     print("Expected for Pixiboo:")
@@ -104,16 +211,7 @@ def scan_i2c():
 
 def get_device_name(addr):
     """Get likely device name from I2C address."""
-    known_devices = {
-        0x28: "BNO055 (9-axis IMU)",
-        0x29: "BNO055 (alt address)",
-        0x68: "MPU6050/MPU9250",
-        0x69: "MPU6050 (alt address)",
-        0x6A: "LSM6DS3",
-        0x76: "BME280/BMP280",
-        0x77: "BME280/BMP280 (alt)",
-    }
-    return known_devices.get(addr, "Unknown device")
+    return KNOWN.get(addr, "Unknown device")
 
 if __name__ == "__main__":
     scan_i2c()
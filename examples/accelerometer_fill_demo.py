@@ -10,6 +10,9 @@ from pixiboo import matrix, accelerometer, init_accelerometer
 from pixiboo.colors import CYAN, GREEN, YELLOW
 import time
 
+# Print a status line for every cursor step
+VERBOSE = False
+
 def main():
     """Main demo loop."""
     print("Accelerometer Fill Demo")
@@ -29,19 +32,20 @@ def main():
     else:
         print("Running in simulation mode\n")
     
-    # Clear the matrix
+    # Clear the matrix (clear() already pushes the frame)
     matrix.clear()
-    matrix.show()
     
-    # Track filled pixels
-    filled_pixels = set()
+    # Track filled pixels: bit (y * 7 + x) is set once that cell is filled
+    filled_mask = 0
+    filled = 0
     
     # Current cursor position (center)
     x = 3
     y = 3
     
     # Mark starting position as filled
-    filled_pixels.add((y, x))
+    filled_mask |= 1 << (y * 7 + x)
+    filled += 1
     
     # Draw starting cursor
     matrix[y][x] = YELLOW
@@ -51,22 +55,22 @@ def main():
     THRESHOLD = 250
     
     # Movement delay to prevent zipping across screen
-    last_move_time = 0
-    MOVE_DELAY = 0.15  # 150ms between moves = slower, more controlled
+    MOVE_DELAY_MS = 150  # 150ms between moves = slower, more controlled
+    # One delay in the past, so the first move is allowed at any uptime
+    last_move_ms = time.ticks_add(time.ticks_ms(), -MOVE_DELAY_MS)
     
     print(f"Movement threshold: ±{THRESHOLD} mg")
-    print(f"Movement delay: {MOVE_DELAY}s between steps")
+    print(f"Movement delay: {MOVE_DELAY_MS}ms between steps")
     print("Colors: Cursor=YELLOW, Filled=GREEN\n")
     
     try:
         while True:
-            # Read accelerometer
-            accel_x = acc.get_x()
-            accel_y = acc.get_y()
+            # Read all three axes in one I2C transaction
+            accel_x, accel_y, _ = acc.get_values()
             
             # Check if enough time has passed since last movement
-            current_time = time.ticks_ms() / 1000.0
-            can_move = (current_time - last_move_time) >= MOVE_DELAY
+            now = time.ticks_ms()
+            can_move = time.ticks_diff(now, last_move_ms) >= MOVE_DELAY_MS
             
             # Determine movement direction
             move_x = 0
@@ -91,8 +95,11 @@ def main():
                     
                     # Only update if we actually moved to a new position
                     if x != old_x or y != old_y:
-                        last_move_time = current_time
-                        filled_pixels.add((y, x))
+                        last_move_ms = now
+                        bit = 1 << (y * 7 + x)
+                        if not filled_mask & bit:
+                            filled_mask |= bit
+                            filled += 1
                         
                         # Change old cursor position to GREEN (filled trail)
                         matrix[old_y][old_x] = GREEN
@@ -104,24 +111,25 @@ def main():
                         matrix.show()
                         
                         # Print movement info
-                        direction = ""
-                        if move_x > 0:
-                            direction += "→"
-                        elif move_x < 0:
-                            direction += "←"
-                        if move_y > 0:
-                            direction += "↓"
-                        elif move_y < 0:
-                            direction += "↑"
-                        
-                        progress = len(filled_pixels) / 49.0 * 100
-                        print(f"[{y},{x}] {direction} | X:{accel_x:5d} Y:{accel_y:5d} | {len(filled_pixels)}/49 ({progress:.0f}%)")
+                        if VERBOSE:
+                            direction = ""
+                            if move_x > 0:
+                                direction += "→"
+                            elif move_x < 0:
+                                direction += "←"
+                            if move_y > 0:
+                                direction += "↓"
+                            elif move_y < 0:
+                                direction += "↑"
+                            
+                            progress = filled / 49.0 * 100
+                            print(f"[{y},{x}] {direction} | X:{accel_x:5d} Y:{accel_y:5d} | {filled}/49 ({progress:.0f}%)")
             
             # Small delay for reading accelerometer
             time.sleep(0.02)
             
     except KeyboardInterrupt:
-        print(f"\nDemo stopped! Filled {len(filled_pixels)}/49 pixels ({len(filled_pixels)/49.0*100:.1f}%)")
+        print(f"\nDemo stopped! Filled {filled}/49 pixels ({filled/49.0*100:.1f}%)")
         time.sleep(2)
         matrix.clear()
         matrix.show()
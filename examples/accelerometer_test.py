@@ -7,6 +7,25 @@ No LED matrix, just debug output.
 
 import pixiboo
 import time
+from array import array
+
+# Number of recent samples kept for the range statistics
+WINDOW = 50
+
+
+def print_ranges(buf, count):
+    """Print min/max/span per axis over the first `count` samples in buf."""
+    if count == 0:
+        return
+    for axis, name in enumerate("XYZ"):
+        lo = hi = buf[axis]
+        for i in range(axis + 3, count * 3, 3):
+            v = buf[i]
+            if v < lo:
+                lo = v
+            elif v > hi:
+                hi = v
+        print(f"  {name} range: {lo:6d} to {hi:6d} (span: {hi-lo:6d} mg)")
 
 def main():
     """Main test loop."""
@@ -38,41 +57,31 @@ def main():
     print("Values in milli-g (mg), where 1000 mg = 1g (gravity)")
     print("\nPress Ctrl+C to stop\n")
     
-    # Sample counters for statistics
+    # Ring buffer of the last WINDOW samples, stored as x, y, z triples
     sample_count = 0
-    x_min, x_max = 0, 0
-    y_min, y_max = 0, 0
-    z_min, z_max = 0, 0
+    buf = array('h', [0] * (WINDOW * 3))
+    idx = 0
     
     try:
         while True:
             # Read values
             x, y, z = accelerometer.get_values()
             
-            # Update statistics
+            # Store the sample; statistics are only computed when printed
             sample_count += 1
-            if sample_count == 1:
-                x_min = x_max = x
-                y_min = y_max = y
-                z_min = z_max = z
-            else:
-                x_min = min(x_min, x)
-                x_max = max(x_max, x)
-                y_min = min(y_min, y)
-                y_max = max(y_max, y)
-                z_min = min(z_min, z)
-                z_max = max(z_max, z)
+            buf[idx] = x
+            buf[idx + 1] = y
+            buf[idx + 2] = z
+            idx = (idx + 3) % (WINDOW * 3)
             
             # Print current reading
             print(f"Sample {sample_count:4d} | X:{x:6d} Y:{y:6d} Z:{z:6d} mg")
             
-            # Print statistics every 50 samples
-            if sample_count % 50 == 0:
+            # Print statistics every WINDOW samples
+            if sample_count % WINDOW == 0:
                 print("-" * 60)
-                print(f"Statistics (last {sample_count} samples):")
-                print(f"  X range: {x_min:6d} to {x_max:6d} (span: {x_max-x_min:6d} mg)")
-                print(f"  Y range: {y_min:6d} to {y_max:6d} (span: {y_max-y_min:6d} mg)")
-                print(f"  Z range: {z_min:6d} to {z_max:6d} (span: {z_max-z_min:6d} mg)")
+                print(f"Statistics (last {WINDOW} samples):")
+                print_ranges(buf, WINDOW)
                 print("-" * 60 + "\n")
             
             # Delay
@@ -80,10 +89,8 @@ def main():
             
     except KeyboardInterrupt:
         print(f"\n\nTest stopped after {sample_count} samples")
-        print("\nFinal statistics:")
-        print(f"  X range: {x_min:6d} to {x_max:6d} (span: {x_max-x_min:6d} mg)")
-        print(f"  Y range: {y_min:6d} to {y_max:6d} (span: {y_max-y_min:6d} mg)")
-        print(f"  Z range: {z_min:6d} to {z_max:6d} (span: {z_max-z_min:6d} mg)")
+        print(f"\nFinal statistics (last {min(sample_count, WINDOW)} samples):")
+        print_ranges(buf, min(sample_count, WINDOW))
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
 from pixiboo import *
+import machine
 import time
 
 try:
@@ -16,37 +17,43 @@ PLAYER_COLOR = (160, 0, 250)
 HEART_OUTLINE = PINK
 HEART_FILL = (255, 170, 210)
 
-def _randrange(n):
+# Chance of a new apple per drop, out of 65536 (0.45)
+APPLE_CHANCE = 29491
+
+def _rand16():
     try:
-        return random.getrandbits(16) % n
+        return random.getrandbits(16)
     except Exception:
-        return random.randrange(n)
+        return random.randrange(65536)
 
 
-def _randfloat():
-    try:
-        return random.getrandbits(16) / 65535
-    except Exception:
-        return random.random()
+def _randrange(n):
+    return _rand16() % n
+
+
+def _is_heart_edge(x, y):
+    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        nx = x + dx
+        ny = y + dy
+        if nx < 0 or nx >= WIDTH or ny < 0 or ny >= HEIGHT:
+            return True
+        if HEART[ny][nx] != "1":
+            return True
+    return False
+
+
+# The heart never changes, so work out its outline once at import.
+_HEART_EDGE = [[_is_heart_edge(x, y) for x in range(WIDTH)] for y in range(HEIGHT)]
 
 
 def draw_heart_outline():
     m.clear()
-    for y, row in enumerate(HEART):
-        for x, ch in enumerate(row):
-            if ch != "1":
-                continue
-            is_edge = False
-            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                nx = x + dx
-                ny = y + dy
-                if nx < 0 or nx >= WIDTH or ny < 0 or ny >= HEIGHT:
-                    is_edge = True
-                    break
-                if HEART[ny][nx] != "1":
-                    is_edge = True
-                    break
-            m[y][x] = HEART_OUTLINE if is_edge else HEART_FILL
+    for y in range(HEIGHT):
+        row = HEART[y]
+        erow = _HEART_EDGE[y]
+        for x in range(WIDTH):
+            if row[x] == "1":
+                m[y][x] = HEART_OUTLINE if erow[x] else HEART_FILL
     m.show()
 
 
@@ -64,55 +71,119 @@ def blink_right_eye():
     e.toggle_right()
 
 
+_LEFT_BIT = 1 << 0
+_CENTER_BIT = 1 << 1
+_RIGHT_BIT = 1 << 2
+
+# Presses seen by the button interrupts since the menu last looked
+_pending = [0]
+
+
+def _on_left():
+    _pending[0] |= _LEFT_BIT
+
+
+def _on_center():
+    _pending[0] |= _CENTER_BIT
+
+
+def _on_right():
+    _pending[0] |= _RIGHT_BIT
+
+
+on_button_pressed(Button.LEFT, _on_left)
+on_button_pressed(Button.CENTER, _on_center)
+on_button_pressed(Button.RIGHT, _on_right)
+
+
+def _take_pending():
+    # Read and clear with interrupts off so no press is lost in between
+    state = machine.disable_irq()
+    pressed = _pending[0]
+    _pending[0] = 0
+    machine.enable_irq(state)
+    return pressed
+
+
+def _read_mask():
+    # One bit per button: left, center, right
+    mask = 0
+    if buttons.is_pressed("left"):
+        mask |= _LEFT_BIT
+    if buttons.is_pressed("center"):
+        mask |= _CENTER_BIT
+    if buttons.is_pressed("right"):
+        mask |= _RIGHT_BIT
+    return mask
+
+
+def _poll_pressed(last_mask):
+    # Fallback when interrupts are unavailable: edge-detect by polling
+    mask = _read_mask()
+    return mask & ~last_mask, mask
+
+
 def wait_for_center():
+    use_irq = buttons.irq_enabled
     # Track button states to debounce manually
-    left_was_pressed = False
-    right_was_pressed = False
-    center_was_pressed = False
+    last_mask = 0
+    _take_pending()
     
     while True:
-        # Read current button states
-        left_now = buttons.is_pressed("left")
-        right_now = buttons.is_pressed("right")
-        center_now = buttons.is_pressed("center")
+        if use_irq:
+            pressed = _take_pending()
+        else:
+            pressed, last_mask = _poll_pressed(last_mask)
         
         # Center button - exit when pressed
-        if center_now and not center_was_pressed:
+        if pressed & _CENTER_BIT:
             # Wait for release
             while buttons.is_pressed("center"):
                 time.sleep_ms(20)
             return
-        center_was_pressed = center_now
         
         # Left button - toggle left eye
-        if left_now and not left_was_pressed:
+        if pressed & _LEFT_BIT:
             e.toggle_left()
-            time.sleep_ms(50)  # Small delay for tactile feedback
-        left_was_pressed = left_now
         
         # Right button - toggle right eye
-        if right_now and not right_was_pressed:
+        if pressed & _RIGHT_BIT:
             e.toggle_right()
-            time.sleep_ms(50)  # Small delay for tactile feedback
-        right_was_pressed = right_now
         
-        time.sleep_ms(30)
+        # Interrupts record presses while we sleep, so we can wake rarely
+        time.sleep_ms(100 if use_irq else 50)
 
 
-def render(player_x, apples):
+# Cells lit by the previous render(), so a frame only blanks what went dark
+_prev_lit = set()
+
+
+def reset_render():
     m.clear()
-    for apple in apples:
-        m[apple[1]][apple[0]] = APPLE_COLOR
+    _prev_lit.clear()
+
+
+def render(player_x, apples):
+    global _prev_lit
+    player = (PLAYER_Y, player_x)
+    new_lit = {(apple[1], apple[0]) for apple in apples}
+    new_lit.add(player)
+    for y, x in _prev_lit - new_lit:
+        m[y][x] = BLACK
+    # Repaint every lit cell: one can turn from apple to player while staying lit
+    for y, x in new_lit:
+        m[y][x] = APPLE_COLOR
     m[PLAYER_Y][player_x] = PLAYER_COLOR
     m.show()
+    _prev_lit = new_lit
 
 
 def move_player(player_x):
     if buttons.left_pressed() and player_x > 0:
-        b.play([(1600, 25)])
+        b.play([(1600, 25)], wait=False)
         return player_x - 1, True
     if buttons.right_pressed() and player_x < WIDTH - 1:
-        b.play([(1600, 25)])
+        b.play([(1600, 25)], wait=False)
         return player_x + 1, True
     return player_x, False
 
@@ -123,6 +194,7 @@ def play_round(high_score):
     score = 0
     last_drop = time.ticks_ms()
     drop_interval = 600
+    reset_render()
 
     while True:
         player_x, moved = move_player(player_x)
@@ -132,21 +204,22 @@ def play_round(high_score):
         if time.ticks_diff(now, last_drop) >= drop_interval:
             last_drop = now
 
-            if _randfloat() < 0.45:
+            if _rand16() < APPLE_CHANCE:
                 apples.append([_randrange(WIDTH), 0])
 
-            next_apples = []
-            for apple in apples:
+            # Walk backwards so fallen apples can be popped in place
+            i = len(apples) - 1
+            while i >= 0:
+                apple = apples[i]
                 apple[1] += 1
                 if apple[1] == PLAYER_Y and apple[0] == player_x:
                     b.play([(220, 200), (196, 220)])
                     return score, max(high_score, score)
-                if apple[1] < HEIGHT:
-                    next_apples.append(apple)
-                else:
+                if apple[1] >= HEIGHT:
+                    apples.pop(i)
                     score += 1
                     b.play([(880, 40), (988, 40)])
-            apples = next_apples
+                i -= 1
 
             drop_interval = max(150, 600 - score * 18)
             updated = True
@@ -162,6 +235,10 @@ def show_high_score(high_score):
     m.display(str(high_score), PURPLE, 450)
 
 
+# Rainbow colors to cycle through while the song plays
+RAINBOW_COLORS = (RED, ORANGE, YELLOW, GREEN, CYAN, BLUE, PURPLE, PINK)
+
+
 def play_tetris_song():
     # Tetris theme (Korobeiniki)
     
@@ -176,9 +253,6 @@ def play_tetris_song():
         [0, 0, 0, 0, 0, 0, 1],
     ]
     
-    # Rainbow colors to cycle through
-    rainbow_colors = [RED, ORANGE, YELLOW, GREEN, CYAN, BLUE, PURPLE, PINK]
-    
     # Tetris melody (frequencies and durations in ms)
     melody = [
         # Main theme part 1
@@ -206,31 +280,42 @@ def play_tetris_song():
         m.display("ERR", RED, 400)
         return
     
+    # Only 7 shifts of the pattern exist, so build their lit pixels up front
+    shifts = [
+        [(y, x) for y in range(7) for x in range(7) if tetris_pattern[y][(x + s) % 7]]
+        for s in range(7)
+    ]
+    
+    # Bind the calls and sizes used per note to locals
+    ncolors = len(RAINBOW_COLORS)
+    _freq = pwm.freq
+    _duty = pwm.duty
+    _sleep = time.sleep_ms
+    
     # Play melody with visual effect
     for note_idx, (freq, duration) in enumerate(melody):
         # Update visual every 4 notes
         if note_idx % 4 == 0:
             m.clear()
-            shift = (note_idx // 4) % 7
-            color_idx = (note_idx // 4) % len(rainbow_colors)
-            color = rainbow_colors[color_idx]
+            step = note_idx >> 2
+            shift = step % 7
+            color_idx = step % ncolors
+            color = RAINBOW_COLORS[color_idx]
             
-            for y in range(7):
-                for x in range(7):
-                    if tetris_pattern[y][(x + shift) % 7]:
-                        m[y][x] = color
+            for y, x in shifts[shift]:
+                m[y][x] = color
             m.show()
         
         # Play note
         if freq > 0:
-            pwm.freq(freq)
-            pwm.duty(512)
-            time.sleep_ms(duration - 20)
-            pwm.duty(0)
-            time.sleep_ms(20)  # Small gap between notes
+            _freq(freq)
+            _duty(512)
+            _sleep(duration - 20)
+            _duty(0)
+            _sleep(20)  # Small gap between notes
         else:
-            pwm.duty(0)
-            time.sleep_ms(duration)
+            _duty(0)
+            _sleep(duration)
     
     # Stop buzzer
     pwm.duty(0)
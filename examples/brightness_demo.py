@@ -3,8 +3,10 @@ import time
 
 levels = [0.1, 0.2, 0.4, 0.6, 0.8, 1.0]
 
+# The picture never changes; set_brightness() redraws it at each level
+m.fill(BLUE)
+
 while True:
     for level in levels:
         set_brightness(level)
-        m.fill(BLUE)
         time.sleep(0.5)
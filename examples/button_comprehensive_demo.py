@@ -14,7 +14,9 @@ set_brightness(0.4)
 
 # Color to cycle through when center button is pressed
 current_color_idx = 0
-colors = [RED, GREEN, BLUE, YELLOW, PURPLE, CYAN, ORANGE, PINK]
+# A tuple is fixed at import; the palette never changes
+colors = (RED, GREEN, BLUE, YELLOW, PURPLE, CYAN, ORANGE, PINK)
+NUM_COLORS = len(colors)
 
 # Counter for left button presses
 left_count = 0
@@ -27,22 +29,16 @@ def on_left_button():
     print(f"Left pressed {left_count} times")
     
     # Flash left side of matrix
-    for col in range(3):
-        for row in range(7):
-            m[row][col] = RED
-    m.show()
+    m.fill_rect(0, 0, 3, 7, RED)
     time.sleep(0.2)
     
     # Clear left side
-    for col in range(3):
-        for row in range(7):
-            m[row][col] = BLACK
-    m.show()
+    m.fill_rect(0, 0, 3, 7, BLACK)
 
 def on_center_button():
     """Called when center button is pressed."""
     global current_color_idx
-    current_color_idx = (current_color_idx + 1) % len(colors)
+    current_color_idx = (current_color_idx + 1) % NUM_COLORS
     
     # Fill with next color
     m.fill(colors[current_color_idx])
@@ -57,17 +53,11 @@ def on_right_button():
     print("Right button pressed!")
     
     # Flash right side of matrix
-    for col in range(4, 7):
-        for row in range(7):
-            m[row][col] = BLUE
-    m.show()
+    m.fill_rect(4, 0, 3, 7, BLUE)
     time.sleep(0.2)
     
     # Clear right side
-    for col in range(4, 7):
-        for row in range(7):
-            m[row][col] = BLACK
-    m.show()
+    m.fill_rect(4, 0, 3, 7, BLACK)
 
 # Register the event handlers
 on_button_pressed(Button.LEFT, on_left_button)
@@ -1,36 +1,46 @@
 from pixiboo import *
-import time
 
 # Start in the center pixel (row 3, column 3)
 row = 3
 col = 3
-colors = [RED, GREEN, BLUE, YELLOW]
+colors = (RED, GREEN, BLUE, YELLOW)
 color_idx = 0
 
+# Looked up once here instead of on every button press
+_LAST_COL = m.WIDTH - 1
+_NCOLORS = len(colors)
+
 set_brightness(0.4)
-buttons = Buttons()
 
-m[row][col] = colors[color_idx]
-m.show()
 
-while True:
-    moved = False
+def update_display():
+    # Clears the old pixel and shows the new one in a single call
+    m.set_pixel_exclusive(col, row, colors[color_idx])
+
 
-    if buttons.left_pressed() and col > 0:
+def on_left():
+    global col
+    if col > 0:
         col -= 1
-        moved = True
+        update_display()
+
 
-    if buttons.right_pressed() and col < m.WIDTH - 1:
+def on_right():
+    global col
+    if col < _LAST_COL:
         col += 1
-        moved = True
+        update_display()
+
+
+def on_center():
+    global color_idx
+    color_idx = (color_idx + 1) % _NCOLORS
+    update_display()
 
-    if buttons.center_pressed():
-        color_idx = (color_idx + 1) % len(colors)
-        moved = True
 
-    if moved:
-        m.clear()
-        m[row][col] = colors[color_idx]
-        m.show()
+# Register callbacks; they fire from button interrupts, no loop needed
+on_button_pressed(Button.LEFT, on_left)
+on_button_pressed(Button.RIGHT, on_right)
+on_button_pressed(Button.CENTER, on_center)
 
-    time.sleep_ms(50)
+update_display()
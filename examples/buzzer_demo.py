@@ -1,20 +1,30 @@
 from pixiboo import *
-import time
+from array import array
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
 
 m.clear()
 
-# Simple rising then falling tones
-melody = [
-    (440, 200),  # A4
-    (523, 200),  # C5
-    (659, 200),  # E5
-    (784, 300),  # G5
-    (659, 200),
-    (523, 200),
-    (440, 400),
-]
+# Simple rising then falling tones, as interleaved (frequency, ms) values
+melody = array('H', [
+    440, 200,  # A4
+    523, 200,  # C5
+    659, 200,  # E5
+    784, 300,  # G5
+    659, 200,
+    523, 200,
+    440, 400,
+])
+
+
+async def main():
+    # Awaiting lets the CPU idle (or run other tasks) while each tone plays
+    while True:
+        await b.play_async(melody)
+        await asyncio.sleep(1)
 
-while True:
-    b.play(melody)
-    time.sleep_ms(1000)
 
+asyncio.run(main())
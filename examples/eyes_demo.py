@@ -39,22 +39,39 @@ time.sleep(0.5)
 eyes.toggle()
 time.sleep(0.5)
 
-# Blink both eyes
-for _ in range(5):
-    eyes.on()
-    time.sleep(0.2)
+# The blink patterns run as asyncio tasks, so other tasks (buttons,
+# sensors) can run while the eyes wait between toggles.
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+
+
+async def blink(times):
+    # Blink both eyes
+    for _ in range(times):
+        eyes.on()
+        await asyncio.sleep(0.2)
+        eyes.off()
+        await asyncio.sleep(0.2)
+
+
+async def alternate(times):
+    # Alternating blink
+    for _ in range(times):
+        eyes.left_on()
+        eyes.right_off()
+        await asyncio.sleep(0.2)
+        eyes.left_off()
+        eyes.right_on()
+        await asyncio.sleep(0.2)
+
+
+async def main():
+    await blink(5)
+    await alternate(5)
+    # Turn off at the end
     eyes.off()
-    time.sleep(0.2)
-
-# Alternating blink
-for _ in range(5):
-    eyes.left_on()
-    eyes.right_off()
-    time.sleep(0.2)
-    eyes.left_off()
-    eyes.right_on()
-    time.sleep(0.2)
-
-# Turn off at the end
-eyes.off()
 
+
+asyncio.run(main())
@@ -6,27 +6,60 @@ Brightness of the matrix corresponds to ambient light level.
 """
 
 from pixiboo import *
-import time
+# Not exported by the package until hardware.py has a LIGHT_SENSOR_PIN
+from pixiboo.lightsensor import LightSensor
+from array import array
+from machine import Timer
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
 
 # Create light sensor instance
 light = LightSensor()
 
-while True:
+# Readings wait in a ring buffer so printing never delays sampling
+LOG_SIZE = 16
+log = array('H', [0] * LOG_SIZE)
+log_head = 0
+log_count = 0
+
+
+def sample(_timer):
+    global log_head, log_count
     # Read light level (0-4095)
     level = light.read()
     
     # Convert to brightness (0.1 to 1.0)
-    brightness = 0.1 + (level / 4095.0) * 0.9
-    set_brightness(brightness)
+    set_brightness(0.1 + (level / 4095.0) * 0.9)
     
-    
-    # Optional: Print light level for debugging
-    print(f"Light level: {level} ({light.read_percent():.1f}%)")
-    
-    time.sleep(0.1)  # Update 10 times per second
-
+    log[log_head] = level
+    log_head = (log_head + 1) % LOG_SIZE
+    if log_count < LOG_SIZE:
+        log_count += 1
 
 
+async def logger():
+    global log_count
+    while True:
+        await asyncio.sleep(0.5)
+        if not log_count:
+            continue
+        # Take the buffered readings, oldest first
+        count = log_count
+        log_count = 0
+        start = log_head - count
+        levels = [log[(start + i) % LOG_SIZE] for i in range(count)]
+        
+        # Optional: Print light level for debugging
+        level = levels[-1]
+        print(f"Light level: {level} ({light.read_percent(level):.1f}%) "
+              f"range {min(levels)}-{max(levels)} over {count} samples")
 
 
+# Sample 10 times per second on a hardware timer
+timer = Timer(0)
+timer.init(period=100, mode=Timer.PERIODIC, callback=sample)
 
+asyncio.run(logger())
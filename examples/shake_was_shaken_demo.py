@@ -6,6 +6,7 @@ in your own loop, allowing you to combine it with other logic.
 """
 
 from pixiboo import *
+import machine
 import time
 
 # Initialize accelerometer
@@ -37,6 +38,10 @@ while True:
         # Play a tone
         buzzer.play([(440 + (shake_count * 100), 100)])
     
-    # Small delay
-    time.sleep(0.05)
+    if acc.shake_interrupt:
+        # The IMU's INT pin flags shakes, so just idle until an interrupt
+        machine.idle()
+    else:
+        # No INT pin: poll the sensor
+        time.sleep(0.05)
 
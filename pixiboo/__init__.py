@@ -21,7 +21,9 @@ from .sprites import HEART
 from .buttons import Buttons, Button
 from .buzzer import Buzzer
 from .eyes import EyeLEDs
-from .accelerometer import Accelerometer, on_shake
+
+# LightSensor is not exported until hardware.py defines LIGHT_SENSOR_PIN
+# for this board; pixiboo.lightsensor can't be imported before then.
 
 m = Matrix()
 b = Buzzer()
@@ -32,19 +34,51 @@ buttons = Buttons()
 # User must call init_accelerometer() or create Accelerometer() manually
 accelerometer = None
 
-def init_accelerometer():
+def _load_accelerometer():
+    """
+    Import the accelerometer driver on first use.
+    
+    It is the largest module and most programs never touch it, so it is
+    not imported with the package.
+    """
+    global accelerometer
+    instance = accelerometer
+    from .accelerometer import Accelerometer, on_shake
+    # Importing the submodule rebinds pixiboo.accelerometer to it
+    accelerometer = instance
+    return Accelerometer, on_shake
+
+def Accelerometer(*args, **kwargs):
+    """
+    Create an accelerometer, importing the driver on first use.
+    
+    Takes the same arguments as pixiboo.accelerometer.Accelerometer.
+    
+    This is a function, not the class, so the package import stays light.
+    For isinstance() checks or subclassing, import the class itself:
+    
+        from pixiboo.accelerometer import Accelerometer
+    """
+    return _load_accelerometer()[0](*args, **kwargs)
+
+def init_accelerometer(use_shake_interrupt: bool = False):
     """
     Initialize the accelerometer (BNO055).
     
     Must be called after import if you want to use the accelerometer.
     The BNO055 can take up to 850ms to boot, so this is not done automatically.
     
+    Args:
+        use_shake_interrupt: Let a BNO055 with its INT line wired flag
+                             shakes instead of polling it
+    
     Returns:
         Accelerometer instance if successful, None if failed
     """
     global accelerometer
     try:
-        accelerometer = Accelerometer()
+        Accelerometer = _load_accelerometer()[0]
+        accelerometer = Accelerometer(use_shake_interrupt=use_shake_interrupt)
         print("[Pixiboo] Accelerometer initialized successfully!")
         return accelerometer
     except Exception as err:
@@ -52,8 +86,20 @@ def init_accelerometer():
         accelerometer = None
         return None
 
+def on_shake(callback, threshold_mg: int = 1500):
+    """
+    Call a function every time the device is shaken (runs forever).
+    
+    Args:
+        callback: Function to call when shake is detected (takes no arguments)
+        threshold_mg: Shake threshold in milli-g (default: 1500)
+    
+    See pixiboo.accelerometer.on_shake for details.
+    """
+    return _load_accelerometer()[1](callback, threshold_mg)
+
 # Helper functions for button events (delegates to buttons instance)
-def on_button_pressed(button: str, callback):
+def on_button_pressed(button, callback):
     """
     Register a callback function to be called when a button is pressed.
     
@@ -69,7 +115,7 @@ def on_button_pressed(button: str, callback):
     """
     buttons.on_button_pressed(button, callback)
 
-def is_pressed(button: str) -> bool:
+def is_pressed(button) -> bool:
     """
     Check if a button is currently pressed.
     
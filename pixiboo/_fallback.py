@@ -0,0 +1,103 @@
+"""
+Host stand-ins for the machine and neopixel modules.
+
+Only imported when the real modules are missing, so pixiboo can be
+imported and exercised on a desktop Python. Not needed on the board.
+"""
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 2
+    IRQ_FALLING = 2
+    IRQ_RISING = 1
+
+    def __init__(self, *_, **__):
+        # Idle high, like a pulled-up input that nobody is pressing
+        self._value = 1
+
+    def value(self, val=None):
+        if val is not None:
+            self._value = val
+        return self._value
+
+    def irq(self, *_, **__):
+        pass
+
+
+class PWM:
+    def __init__(self, *_args, **__):
+        self._duty = 0
+
+    def duty(self, value=None):
+        if value is not None:
+            self._duty = value
+        return self._duty
+
+    def duty_u16(self, value=None):
+        if value is not None:
+            self._duty = value
+        return self._duty
+
+    def freq(self, *_args, **__):
+        return None
+
+
+class Timer:
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, *_args, **__):
+        pass
+
+    def init(self, *_args, **__):
+        pass
+
+    def deinit(self):
+        pass
+
+
+class ADC:
+    def __init__(self, *_args, **__):
+        self._value = 2048  # Simulate mid-range value
+
+    def read(self):
+        return self._value
+
+    def read_u16(self):
+        return self._value << 4  # Convert to 16-bit range
+
+
+class I2C:
+    def __init__(self, *_, **__):
+        pass
+
+    def readfrom_mem(self, addr, reg, nbytes):
+        return bytes([0] * nbytes)
+
+    def readfrom_mem_into(self, addr, reg, buf):
+        for i in range(len(buf)):
+            buf[i] = 0
+
+    def writeto_mem(self, addr, reg, buf):
+        pass
+
+    def scan(self):
+        return []
+
+
+class NeoPixel:
+    ORDER = (1, 0, 2, 3)
+
+    def __init__(self, _pin, n, bpp=3):
+        self.bpp = bpp
+        self.buf = bytearray(n * bpp)
+
+    def __setitem__(self, idx, color):
+        offset = idx * self.bpp
+        for i in range(self.bpp):
+            self.buf[offset + self.ORDER[i]] = color[i]
+
+    def write(self):
+        pass
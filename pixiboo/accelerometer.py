@@ -4,36 +4,18 @@ Accelerometer access for Pixiboo, similar to micro:bit API.
 Supports common I2C accelerometers/IMUs like MPU6050, MPU9250, LSM6DS3.
 """
 
-from .hardware import I2C_SCL_PIN, I2C_SDA_PIN, IMU_RESET_PIN, IMU_ADDRESS_SELECT_PIN
+from .hardware import (
+    I2C_SCL_PIN,
+    I2C_SDA_PIN,
+    IMU_RESET_PIN,
+    IMU_INTERRUPT_PIN,
+    IMU_ADDRESS_SELECT_PIN,
+)
 
 try:
     from machine import Pin, I2C
 except ImportError:  # pragma: no cover - host fallback
-    class Pin:  # type: ignore
-        OUT = 1
-
-        def __init__(self, *_, **__):
-            pass
-
-        def value(self, val=None):
-            if val is None:
-                return 0
-            return None
-
-    class I2C:  # type: ignore
-        def __init__(self, *_, **__):
-            self._x = 0
-            self._y = 0
-            self._z = 0
-
-        def readfrom_mem(self, addr, reg, nbytes):
-            return bytes([0] * nbytes)
-
-        def writeto_mem(self, addr, reg, buf):
-            pass
-
-        def scan(self):
-            return []
+    from ._fallback import Pin, I2C
 
 try:
     import utime as _time
@@ -47,50 +29,162 @@ except ImportError:  # pragma: no cover
         import sys
         math = sys.modules.get('math', None)
 
+try:
+    from array import array
+except ImportError:  # pragma: no cover
+    array = None
+
+try:
+    import micropython
+    from micropython import const
+except ImportError:  # pragma: no cover - host fallback
+    class micropython:  # type: ignore
+        @staticmethod
+        def native(func):
+            return func
+
+    def const(value):
+        return value
 
-def _sleep_ms(ms: int) -> None:
-    if hasattr(_time, "sleep_ms"):
-        _time.sleep_ms(ms)  # type: ignore[attr-defined]
-    else:
+import sys
+
+
+# Resolved once at import instead of feature-testing on every call
+if hasattr(_time, "sleep_ms"):
+    _sleep_ms = _time.sleep_ms  # type: ignore[attr-defined]
+else:  # pragma: no cover
+    def _sleep_ms(ms: int) -> None:
         _time.sleep(ms / 1000.0)
 
+if hasattr(_time, "ticks_ms"):
+    _ticks_ms = _time.ticks_ms  # type: ignore[attr-defined]
+    _ticks_diff = _time.ticks_diff  # type: ignore[attr-defined]
+else:  # pragma: no cover
+    def _ticks_ms() -> int:
+        return int(_time.time() * 1000)
+
+    def _ticks_diff(a: int, b: int) -> int:
+        return a - b
+
+
+# Set to 1 to print IMU detection and setup progress. Call sites test it
+# themselves, so with 0 the compiler drops the prints and their f-strings.
+_DEBUG = const(0)
+
+
+try:
+    from machine import idle as _idle
+except ImportError:  # pragma: no cover - host fallback
+    def _idle() -> None:
+        _sleep_ms(1)
+
 
 # Common IMU I2C addresses
-MPU6050_ADDR = 0x68
-MPU6050_ADDR_ALT = 0x69
-LSM6DS3_ADDR = 0x6A
-MPU9250_ADDR = 0x68
-BNO055_ADDR = 0x28
-BNO055_ADDR_ALT = 0x29
+_MPU6050_ADDR = const(0x68)
+_MPU6050_ADDR_ALT = const(0x69)
+_LSM6DS3_ADDR = const(0x6A)
+_MPU9250_ADDR = const(0x68)
+_BNO055_ADDR = const(0x28)
+_BNO055_ADDR_ALT = const(0x29)
 
 # MPU6050 register addresses
-MPU6050_REG_PWR_MGMT_1 = 0x6B
-MPU6050_REG_ACCEL_XOUT_H = 0x3B
-MPU6050_REG_WHO_AM_I = 0x75
+_MPU6050_REG_PWR_MGMT_1 = const(0x6B)
+_MPU6050_REG_ACCEL_XOUT_H = const(0x3B)
+_MPU6050_REG_WHO_AM_I = const(0x75)
 
 # LSM6DS3 register addresses
-LSM6DS3_REG_CTRL1_XL = 0x10
-LSM6DS3_REG_OUTX_L_XL = 0x28
-LSM6DS3_REG_WHO_AM_I = 0x0F
+_LSM6DS3_REG_CTRL1_XL = const(0x10)
+_LSM6DS3_REG_OUTX_L_XL = const(0x28)
+_LSM6DS3_REG_WHO_AM_I = const(0x0F)
 
 # BNO055 register addresses
-BNO055_REG_CHIP_ID = 0x00
-BNO055_REG_PAGE_ID = 0x07
-BNO055_REG_OPR_MODE = 0x3D
-BNO055_REG_PWR_MODE = 0x3E
-BNO055_REG_SYS_TRIGGER = 0x3F
-BNO055_REG_ACCEL_DATA_X_LSB = 0x08
-BNO055_REG_ACCEL_DATA_X_MSB = 0x09
-BNO055_REG_ACCEL_DATA_Y_LSB = 0x0A
-BNO055_REG_ACCEL_DATA_Y_MSB = 0x0B
-BNO055_REG_ACCEL_DATA_Z_LSB = 0x0C
-BNO055_REG_ACCEL_DATA_Z_MSB = 0x0D
+_BNO055_REG_CHIP_ID = const(0x00)
+_BNO055_REG_PAGE_ID = const(0x07)
+_BNO055_REG_OPR_MODE = const(0x3D)
+_BNO055_REG_PWR_MODE = const(0x3E)
+_BNO055_REG_SYS_TRIGGER = const(0x3F)
+_BNO055_REG_ACCEL_DATA_X_LSB = const(0x08)
+_BNO055_REG_ACCEL_DATA_X_MSB = const(0x09)
+_BNO055_REG_ACCEL_DATA_Y_LSB = const(0x0A)
+_BNO055_REG_ACCEL_DATA_Y_MSB = const(0x0B)
+_BNO055_REG_ACCEL_DATA_Z_LSB = const(0x0C)
+_BNO055_REG_ACCEL_DATA_Z_MSB = const(0x0D)
+
+# BNO055 page 1 (interrupt) register addresses
+_BNO055_REG_INT_MSK = const(0x0F)
+_BNO055_REG_INT_EN = const(0x10)
+_BNO055_REG_ACC_INT_SETTINGS = const(0x12)
+_BNO055_REG_ACC_HG_DURATION = const(0x13)
+_BNO055_REG_ACC_HG_THRES = const(0x14)
 
 # BNO055 constants
-BNO055_ID = 0xA0
-BNO055_OPERATION_MODE_CONFIG = 0x00
-BNO055_OPERATION_MODE_NDOF = 0x0C  # 9-DOF fusion mode
-BNO055_POWER_MODE_NORMAL = 0x00
+_BNO055_ID = const(0xA0)
+_BNO055_OPERATION_MODE_CONFIG = const(0x00)
+_BNO055_OPERATION_MODE_NDOF = const(0x0C)  # 9-DOF fusion mode
+_BNO055_POWER_MODE_NORMAL = const(0x00)
+_BNO055_SYS_TRIGGER_RST_INT = const(0x40)  # Clear the latched INT pin
+_BNO055_INT_ACC_HIGH_G = const(0x20)
+_BNO055_ACC_INT_HG_XYZ = const(0xE0)  # High-g on X, Y and Z
+_BNO055_HG_DURATION = const(0x04)  # (1 + 4) * 2 ms above threshold
+_BNO055_HG_UMG_PER_LSB = const(15630)  # High-g threshold step at the fusion 4g range (15.63 mg)
+
+# BNO055 setup before fusion mode: (register, value, settle time in ms)
+_BNO055_INIT = (
+    (_BNO055_REG_OPR_MODE, bytes([_BNO055_OPERATION_MODE_CONFIG]), 25),  # Config mode first
+    (_BNO055_REG_PWR_MODE, bytes([_BNO055_POWER_MODE_NORMAL]), 10),
+    (_BNO055_REG_PAGE_ID, b"\x00", 10),
+    (_BNO055_REG_SYS_TRIGGER, b"\x00", 10),
+)
+
+# Time between new samples at each IMU's output data rate
+_MPU6050_SAMPLE_MS = const(1)  # 1 kHz accelerometer output
+_LSM6DS3_SAMPLE_MS = const(10)  # 104 Hz, set in _init_lsm6ds3()
+_BNO055_SAMPLE_MS = const(10)  # 100 Hz in NDOF fusion mode
+
+# Raw-to-mg scale factors in 1/1024ths, so decoding needs no floats
+_MPU6050_SCALE = const(125)  # 0.122 mg/LSB at ±2g
+_LSM6DS3_SCALE = const(125)  # 0.122 mg/LSB at ±2g
+_BNO055_SCALE = const(1044)  # 1 LSB = 0.01 m/s² = 1.02 mg
+
+# How to read each IMU: (first data register, big-endian, scale, sample ms)
+_IMU_TABLE = {
+    "mpu6050": (_MPU6050_REG_ACCEL_XOUT_H, 1, _MPU6050_SCALE, _MPU6050_SAMPLE_MS),
+    "lsm6ds3": (_LSM6DS3_REG_OUTX_L_XL, 0, _LSM6DS3_SCALE, _LSM6DS3_SAMPLE_MS),
+    "bno055": (_BNO055_REG_ACCEL_DATA_X_LSB, 0, _BNO055_SCALE, _BNO055_SAMPLE_MS),
+}
+
+
+if sys.implementation.name == "micropython":
+    @micropython.viper
+    def _decode_xyz(buf: ptr8, out: ptr32, big_endian: int, scale: int):
+        # Three signed 16-bit samples -> mg, written to out[0..2]
+        i = 0
+        while i < 3:
+            if big_endian:
+                v = (int(buf[2 * i]) << 8) | int(buf[2 * i + 1])
+            else:
+                v = int(buf[2 * i]) | (int(buf[2 * i + 1]) << 8)
+            if v & 0x8000:
+                v -= 0x10000
+            out[i] = (v * scale) >> 10
+            i += 1
+
+    @micropython.viper
+    def _over_threshold(x: int, y: int, z: int, threshold_sq: int) -> int:
+        # 1 if the (x, y, z) vector is longer than sqrt(threshold_sq)
+        return int(x * x + y * y + z * z > threshold_sq)
+else:  # pragma: no cover - host fallback
+    import struct
+
+    def _decode_xyz(buf, out, big_endian, scale):
+        # unpack_from sign-extends all three axes in one call
+        x, y, z = struct.unpack_from(">hhh" if big_endian else "<hhh", buf, 0)
+        out[0] = (x * scale) >> 10
+        out[1] = (y * scale) >> 10
+        out[2] = (z * scale) >> 10
+
+    def _over_threshold(x, y, z, threshold_sq):
+        return int(x * x + y * y + z * z > threshold_sq)
 
 
 class Accelerometer:
@@ -101,49 +195,65 @@ class Accelerometer:
     Values typically range from -2000 to +2000 mg (±2g range).
     """
 
-    def __init__(self, i2c_freq: int = 100000):
+    def __init__(self, i2c_freq: int = 400000, use_shake_interrupt: bool = False):
         """
         Initialize the accelerometer.
         
         Args:
-            i2c_freq: I2C bus frequency in Hz (default 100kHz - matches working config)
+            i2c_freq: I2C bus frequency in Hz (default 400kHz fast mode; falls
+                      back to 100kHz if nothing answers)
+            use_shake_interrupt: On a BNO055 with its INT line wired to
+                      IMU_INTERRUPT_PIN, let the sensor flag shakes instead
+                      of polling it. Only used if the interrupt setup reads
+                      back correctly; check the shake_interrupt attribute.
         """
         # Try multiple I2C configurations to find what works
         # The scanner found it, so we need to match that configuration exactly
         self._i2c = None
         self._addr = None
         self._imu_type = None
+        # Raw sample bytes and decoded x, y, z in mg, reused by every read
+        self._buf = bytearray(6)
+        self._xyz = array("i", [0, 0, 0])
         
-        # Give BNO055 time to boot FIRST (brute-force scanner confirmed 1s wait works)
-        # Match the scanner exactly - no pin manipulation before I2C init
-        print("[Accelerometer] Waiting for BNO055 to boot (1s)...")
-        _sleep_ms(1000)
-        
-        # Try I2C configuration that worked in brute-force scanner
-        # SDA=GPIO16, SCL=GPIO15 @ 100kHz on I2C(0)
+        # SDA=GPIO16, SCL=GPIO15 on I2C(0); the BNO055 supports 400kHz fast mode
         try:
-            print(f"[Accelerometer] Creating I2C(0) with SDA=GPIO{I2C_SDA_PIN}, SCL=GPIO{I2C_SCL_PIN} @ 100kHz...")
-            self._i2c = I2C(0, scl=Pin(I2C_SCL_PIN), sda=Pin(I2C_SDA_PIN), freq=100000)
+            if _DEBUG:
+                print(f"[Accelerometer] Creating I2C(0) with SDA=GPIO{I2C_SDA_PIN}, SCL=GPIO{I2C_SCL_PIN} @ {i2c_freq // 1000}kHz...")
+            self._i2c = I2C(0, scl=Pin(I2C_SCL_PIN), sda=Pin(I2C_SDA_PIN), freq=i2c_freq)
             _sleep_ms(20)  # Small delay after creating I2C (like scanner)
             
-            # Scan for devices
+            # Scan for devices. A cold BNO055 takes up to ~850ms to boot, so
+            # keep rescanning for up to 1s; other IMUs (or a BNO055 that is
+            # already running) answer straight away.
             devices = self._i2c.scan()
-            if devices:
-                print(f"[Accelerometer] I2C scan found devices: {[hex(d) for d in devices]}")
-            else:
-                print("[Accelerometer] I2C scan found no devices")
+            waited = 0
+            while not devices and waited < 1000:
+                _sleep_ms(50)
+                waited += 50
+                devices = self._i2c.scan()
+            if not devices:
+                if _DEBUG:
+                    print("[Accelerometer] I2C scan found no devices")
                 self._i2c = None
+            elif _DEBUG:
+                print(f"[Accelerometer] I2C scan found devices: {[hex(d) for d in devices]}")
         except Exception as err:
-            print(f"[Accelerometer] I2C initialization failed: {err}")
+            if _DEBUG:
+                print(f"[Accelerometer] I2C initialization failed: {err}")
             self._i2c = None
         
         # Fallback: try other configs if first one failed
         if self._i2c is None:
-            print("[Accelerometer] Trying fallback I2C configurations...")
+            if _DEBUG:
+                print("[Accelerometer] Trying fallback I2C configurations...")
+            # 100kHz is what the brute-force scanner confirmed on weak pull-ups
             i2c_configs = [
-                (0, 400000),  # I2C0 @ 400kHz
+                (0, 100000),  # I2C0 @ 100kHz
                 (1, 100000),  # I2C1 @ 100kHz
             ]
+            if i2c_freq == 100000:
+                i2c_configs[0] = (0, 400000)  # I2C0 @ 400kHz
             
             for i2c_id, freq in i2c_configs:
                 try:
@@ -151,42 +261,56 @@ class Accelerometer:
                     _sleep_ms(20)
                     devices = self._i2c.scan()
                     if devices:
-                        print(f"[Accelerometer] I2C({i2c_id}) @ {freq}Hz found devices: {[hex(d) for d in devices]}")
+                        if _DEBUG:
+                            print(f"[Accelerometer] I2C({i2c_id}) @ {freq}Hz found devices: {[hex(d) for d in devices]}")
                         break
                     else:
                         self._i2c = None
                 except Exception as err:
-                    print(f"[Accelerometer] I2C({i2c_id}) @ {freq}Hz failed: {err}")
+                    if _DEBUG:
+                        print(f"[Accelerometer] I2C({i2c_id}) @ {freq}Hz failed: {err}")
                     self._i2c = None
                     continue
         
         if self._i2c is None:
             raise RuntimeError("Failed to initialize I2C bus - no working configuration found")
         
+        # Shake detection state (the BNO055 init programs its threshold)
+        self._shake_threshold = 1500  # mg - threshold for shake detection
+        self._shake_threshold_sq = 1500 * 1500  # Compared against magnitude squared
+        self._shake_detected = False  # True if shake was detected
+        self._last_shake_time = 0  # Timestamp of last shake detection
+        self._shake_debounce_ms = 500  # Debounce time in milliseconds
+        
+        # Set by the IMU's INT pin when a BNO055 shake interrupt fires
+        self.shake_interrupt = False
+        self._use_shake_interrupt = use_shake_interrupt
+        self._int_flag = False
+        
         # Auto-detect IMU
         self._detect_imu()
+        if self._imu_type == "bno055" and use_shake_interrupt:
+            self._setup_shake_interrupt()
         
         # Calibration offsets (can be set by user)
         self._offset_x = 0
         self._offset_y = 0
         self._offset_z = 0
         
-        # Last read values
+        # Last read values, reused for _cache_ttl_ms so that get_x(),
+        # get_y() and get_z() in a row cost one I2C read
         self._x = 0
         self._y = 0
         self._z = 0
-        
-        # Shake detection state
-        self._shake_threshold = 1500  # mg - threshold for shake detection
-        self._shake_detected = False  # True if shake was detected
-        self._last_shake_time = 0  # Timestamp of last shake detection
-        self._shake_debounce_ms = 500  # Debounce time in milliseconds
+        self._read_ms = None
+        self._cache_ttl_ms = 5
 
     def _detect_imu(self) -> None:
         """Auto-detect which IMU is connected."""
         devices = self._i2c.scan()
         
-        print(f"[Accelerometer] I2C scan found devices: {[hex(d) for d in devices]}")
+        if _DEBUG:
+            print(f"[Accelerometer] I2C scan found devices: {[hex(d) for d in devices]}")
         
         if not devices:
             # No I2C device found
@@ -198,195 +322,174 @@ class Accelerometer:
             raise RuntimeError("No accelerometer detected on I2C bus")
         
         # Try BNO055 first (Pixiboo uses this!)
-        if BNO055_ADDR in devices:
-            self._addr = BNO055_ADDR
+        if _BNO055_ADDR in devices:
+            self._addr = _BNO055_ADDR
             self._imu_type = "bno055"
-            print(f"[Accelerometer] Detected BNO055 at address {hex(self._addr)}")
+            if _DEBUG:
+                print(f"[Accelerometer] Detected BNO055 at address {hex(self._addr)}")
             self._init_bno055()
-        elif BNO055_ADDR_ALT in devices:
-            self._addr = BNO055_ADDR_ALT
+        elif _BNO055_ADDR_ALT in devices:
+            self._addr = _BNO055_ADDR_ALT
             self._imu_type = "bno055"
-            print(f"[Accelerometer] Detected BNO055 at alternate address {hex(self._addr)}")
+            if _DEBUG:
+                print(f"[Accelerometer] Detected BNO055 at alternate address {hex(self._addr)}")
             self._init_bno055()
         # Try MPU6050/MPU9250
-        elif MPU6050_ADDR in devices:
-            self._addr = MPU6050_ADDR
+        elif _MPU6050_ADDR in devices:
+            self._addr = _MPU6050_ADDR
             self._imu_type = "mpu6050"
-            print(f"[Accelerometer] Detected MPU6050 at address {hex(self._addr)}")
+            if _DEBUG:
+                print(f"[Accelerometer] Detected MPU6050 at address {hex(self._addr)}")
             self._init_mpu6050()
-        elif MPU6050_ADDR_ALT in devices:
-            self._addr = MPU6050_ADDR_ALT
+        elif _MPU6050_ADDR_ALT in devices:
+            self._addr = _MPU6050_ADDR_ALT
             self._imu_type = "mpu6050"
-            print(f"[Accelerometer] Detected MPU6050 at alternate address {hex(self._addr)}")
+            if _DEBUG:
+                print(f"[Accelerometer] Detected MPU6050 at alternate address {hex(self._addr)}")
             self._init_mpu6050()
-        elif LSM6DS3_ADDR in devices:
-            self._addr = LSM6DS3_ADDR
+        elif _LSM6DS3_ADDR in devices:
+            self._addr = _LSM6DS3_ADDR
             self._imu_type = "lsm6ds3"
-            print(f"[Accelerometer] Detected LSM6DS3 at address {hex(self._addr)}")
+            if _DEBUG:
+                print(f"[Accelerometer] Detected LSM6DS3 at address {hex(self._addr)}")
             self._init_lsm6ds3()
         else:
             # Unknown device
             print(f"[Accelerometer] ERROR: Unknown I2C device at {[hex(d) for d in devices]}")
             print("[Accelerometer] Expected BNO055 at 0x28 or 0x29")
             raise RuntimeError(f"Unknown accelerometer at address {[hex(d) for d in devices]}")
+        
+        self._reg, self._big_endian, self._scale, self._sample_ms = _IMU_TABLE[self._imu_type]
 
     def _init_mpu6050(self) -> None:
         """Initialize MPU6050/MPU9250."""
         # Wake up the MPU6050 (clear sleep mode)
-        self._i2c.writeto_mem(self._addr, MPU6050_REG_PWR_MGMT_1, bytes([0]))
+        self._i2c.writeto_mem(self._addr, _MPU6050_REG_PWR_MGMT_1, bytes([0]))
         _sleep_ms(10)
 
     def _init_lsm6ds3(self) -> None:
         """Initialize LSM6DS3."""
         # Enable accelerometer at 104 Hz, ±2g range
-        self._i2c.writeto_mem(self._addr, LSM6DS3_REG_CTRL1_XL, bytes([0x40]))
+        self._i2c.writeto_mem(self._addr, _LSM6DS3_REG_CTRL1_XL, bytes([0x40]))
         _sleep_ms(10)
 
     def _init_bno055(self) -> None:
         """Initialize BNO055 - follows Adafruit library initialization sequence."""
-        print("[Accelerometer] Initializing BNO055...")
+        if _DEBUG:
+            print("[Accelerometer] Initializing BNO055...")
         
         # BNO055 can take up to 850ms to boot - wait for it
         timeout = 850
         chip_id = 0
         while timeout > 0:
             try:
-                chip_id = self._i2c.readfrom_mem(self._addr, BNO055_REG_CHIP_ID, 1)[0]
-                if chip_id == BNO055_ID:
+                chip_id = self._i2c.readfrom_mem(self._addr, _BNO055_REG_CHIP_ID, 1)[0]
+                if chip_id == _BNO055_ID:
                     break
             except Exception:
                 pass
             _sleep_ms(10)
             timeout -= 10
         
-        if chip_id != BNO055_ID:
+        if chip_id != _BNO055_ID:
             # Try one more time after longer delay
             _sleep_ms(100)
             try:
-                chip_id = self._i2c.readfrom_mem(self._addr, BNO055_REG_CHIP_ID, 1)[0]
+                chip_id = self._i2c.readfrom_mem(self._addr, _BNO055_REG_CHIP_ID, 1)[0]
             except Exception as e:
                 raise RuntimeError(f"BNO055 not responding: {e}")
             
-            if chip_id != BNO055_ID:
-                raise RuntimeError(f"BNO055 wrong chip ID: got {hex(chip_id)}, expected {hex(BNO055_ID)}")
+            if chip_id != _BNO055_ID:
+                raise RuntimeError(f"BNO055 wrong chip ID: got {hex(chip_id)}, expected {hex(_BNO055_ID)}")
         
-        print(f"[Accelerometer] BNO055 Chip ID verified: {hex(chip_id)}")
-        
-        # Switch to config mode (required before changing settings)
-        self._i2c.writeto_mem(self._addr, BNO055_REG_OPR_MODE, bytes([BNO055_OPERATION_MODE_CONFIG]))
-        _sleep_ms(25)
+        if _DEBUG:
+            print(f"[Accelerometer] BNO055 Chip ID verified: {hex(chip_id)}")
         
         # Note: some boards fail after reset. Try without reset first.
-        # Set to normal power mode
-        self._i2c.writeto_mem(self._addr, BNO055_REG_PWR_MODE, bytes([BNO055_POWER_MODE_NORMAL]))
-        _sleep_ms(10)
-        
-        # Set page ID to 0
-        self._i2c.writeto_mem(self._addr, BNO055_REG_PAGE_ID, bytes([0x00]))
-        _sleep_ms(10)
+        for reg, value, delay in _BNO055_INIT:
+            self._i2c.writeto_mem(self._addr, reg, value)
+            _sleep_ms(delay)
         
-        # Clear system trigger
-        self._i2c.writeto_mem(self._addr, BNO055_REG_SYS_TRIGGER, bytes([0x00]))
-        _sleep_ms(10)
+        # Raise INT on high-g so shakes don't need polling
+        if self._use_shake_interrupt:
+            try:
+                self._config_bno055_shake_int()
+            except Exception as err:
+                print(f"[Accelerometer] Shake interrupt setup failed: {err}")
         
         # Set to NDOF mode (9-DOF fusion mode)
-        print("[Accelerometer] Setting BNO055 to NDOF mode...")
-        self._i2c.writeto_mem(self._addr, BNO055_REG_OPR_MODE, bytes([BNO055_OPERATION_MODE_NDOF]))
+        if _DEBUG:
+            print("[Accelerometer] Setting BNO055 to NDOF mode...")
+        self._i2c.writeto_mem(self._addr, _BNO055_REG_OPR_MODE, bytes([_BNO055_OPERATION_MODE_NDOF]))
         _sleep_ms(20)
         
-        print("[Accelerometer] BNO055 initialized successfully!")
-
-    def _read_mpu6050(self) -> tuple[int, int, int]:
-        """Read acceleration from MPU6050/MPU9250."""
-        # Read 6 bytes starting from ACCEL_XOUT_H
-        data = self._i2c.readfrom_mem(self._addr, MPU6050_REG_ACCEL_XOUT_H, 6)
-        
-        # Convert to signed 16-bit values
-        x = (data[0] << 8) | data[1]
-        y = (data[2] << 8) | data[3]
-        z = (data[4] << 8) | data[5]
-        
-        # Convert to signed integers
-        if x > 32767:
-            x -= 65536
-        if y > 32767:
-            y -= 65536
-        if z > 32767:
-            z -= 65536
-        
-        # Convert from raw values (±16384 = ±2g) to milli-g
-        # Scale factor: 2000 mg / 16384 = 0.122 mg/LSB
-        x_mg = int(x * 0.122)
-        y_mg = int(y * 0.122)
-        z_mg = int(z * 0.122)
-        
-        return (x_mg, y_mg, z_mg)
-
-    def _read_lsm6ds3(self) -> tuple[int, int, int]:
-        """Read acceleration from LSM6DS3."""
-        # Read 6 bytes starting from OUTX_L_XL
-        data = self._i2c.readfrom_mem(self._addr, LSM6DS3_REG_OUTX_L_XL, 6)
-        
-        # LSM6DS3 is little-endian
-        x = (data[1] << 8) | data[0]
-        y = (data[3] << 8) | data[2]
-        z = (data[5] << 8) | data[4]
-        
-        # Convert to signed integers
-        if x > 32767:
-            x -= 65536
-        if y > 32767:
-            y -= 65536
-        if z > 32767:
-            z -= 65536
-        
-        # Convert from raw values (±16384 = ±2g) to milli-g
-        x_mg = int(x * 0.122)
-        y_mg = int(y * 0.122)
-        z_mg = int(z * 0.122)
-        
-        return (x_mg, y_mg, z_mg)
-
-    def _read_bno055(self) -> tuple[int, int, int]:
-        """Read acceleration from BNO055."""
-        # Read 6 bytes starting from ACCEL_DATA_X_LSB
-        data = self._i2c.readfrom_mem(self._addr, BNO055_REG_ACCEL_DATA_X_LSB, 6)
-        
-        # BNO055 is little-endian
-        x = (data[1] << 8) | data[0]
-        y = (data[3] << 8) | data[2]
-        z = (data[5] << 8) | data[4]
-        
-        # Convert to signed integers
-        if x > 32767:
-            x -= 65536
-        if y > 32767:
-            y -= 65536
-        if z > 32767:
-            z -= 65536
-        
-        # BNO055 accelerometer data is in m/s²
-        # 1 m/s² = ~102 mg (milligravity)
-        # BNO055 scale: 1 LSB = 0.01 m/s² = 1.02 mg
-        # So multiply by ~1.02 to convert to mg
-        # Or more accurately: 100 m/s² = 1g = 1000 mg, so 1 m/s² = 102 mg
-        # BNO055 LSB = 0.01 m/s², so 1 LSB = 1.02 mg
-        x_mg = int(x * 1.02)
-        y_mg = int(y * 1.02)
-        z_mg = int(z * 1.02)
-        
-        return (x_mg, y_mg, z_mg)
+        if _DEBUG:
+            print("[Accelerometer] BNO055 initialized successfully!")
+
+    def _config_bno055_shake_int(self) -> None:
+        """Program the BNO055 high-g interrupt (must be in config mode)."""
+        self._i2c.writeto_mem(self._addr, _BNO055_REG_PAGE_ID, bytes([0x01]))
+        _sleep_ms(10)
+        self._i2c.writeto_mem(self._addr, _BNO055_REG_ACC_INT_SETTINGS, bytes([_BNO055_ACC_INT_HG_XYZ]))
+        self._i2c.writeto_mem(self._addr, _BNO055_REG_ACC_HG_DURATION, bytes([_BNO055_HG_DURATION]))
+        self._i2c.writeto_mem(self._addr, _BNO055_REG_ACC_HG_THRES, bytes([self._hg_threshold()]))
+        self._i2c.writeto_mem(self._addr, _BNO055_REG_INT_MSK, bytes([_BNO055_INT_ACC_HIGH_G]))
+        self._i2c.writeto_mem(self._addr, _BNO055_REG_INT_EN, bytes([_BNO055_INT_ACC_HIGH_G]))
+        self._i2c.writeto_mem(self._addr, _BNO055_REG_PAGE_ID, bytes([0x00]))
+        _sleep_ms(10)
 
+    def _hg_threshold(self) -> int:
+        """Shake threshold converted to the BNO055 high-g register value."""
+        value = self._shake_threshold * 1000 // _BNO055_HG_UMG_PER_LSB
+        return max(0, min(255, value))
+
+    def _shake_int_configured(self) -> bool:
+        """True if the BNO055 reads back the high-g INT_EN/INT_MSK bits."""
+        self._i2c.writeto_mem(self._addr, _BNO055_REG_PAGE_ID, bytes([0x01]))
+        try:
+            msk = self._i2c.readfrom_mem(self._addr, _BNO055_REG_INT_MSK, 1)[0]
+            en = self._i2c.readfrom_mem(self._addr, _BNO055_REG_INT_EN, 1)[0]
+        finally:
+            self._i2c.writeto_mem(self._addr, _BNO055_REG_PAGE_ID, bytes([0x00]))
+        return bool(msk & en & _BNO055_INT_ACC_HIGH_G)
+
+    def _setup_shake_interrupt(self) -> None:
+        """Watch the BNO055 INT pin so was_shaken() can skip I2C reads."""
+        try:
+            if not self._shake_int_configured():
+                raise RuntimeError("high-g interrupt did not read back")
+            self._int_pin = Pin(IMU_INTERRUPT_PIN, Pin.IN)
+            # Start from a clear latch so the first shake gives an edge
+            self._i2c.writeto_mem(self._addr, _BNO055_REG_SYS_TRIGGER, bytes([_BNO055_SYS_TRIGGER_RST_INT]))
+            _sleep_ms(1)
+            # A cleared INT line idles low; high means it isn't the INT line
+            if self._int_pin.value():
+                raise RuntimeError(f"GPIO{IMU_INTERRUPT_PIN} is high with INT cleared")
+            self._int_pin.irq(trigger=Pin.IRQ_RISING, handler=self._on_int)
+            self.shake_interrupt = True
+        except Exception as err:
+            print(f"[Accelerometer] Shake interrupt unavailable, polling instead: {err}")
+            self.shake_interrupt = False
+
+    def _on_int(self, _pin) -> None:
+        # Runs in interrupt context: just record the event
+        self._int_flag = True
+
+    @micropython.native
     def _read_raw(self) -> tuple[int, int, int]:
-        """Read raw acceleration values from the IMU."""
-        if self._imu_type == "bno055":
-            return self._read_bno055()
-        elif self._imu_type == "mpu6050":
-            return self._read_mpu6050()
-        elif self._imu_type == "lsm6ds3":
-            return self._read_lsm6ds3()
-        else:
-            raise RuntimeError("No accelerometer initialized")
+        """Read acceleration in mg from the detected IMU."""
+        self._i2c.readfrom_mem_into(self._addr, self._reg, self._buf)
+        out = self._xyz
+        _decode_xyz(self._buf, out, self._big_endian, self._scale)
+        return (out[0], out[1], out[2])
+
+    @micropython.native
+    def _maybe_read(self) -> None:
+        """Refresh the cached sample unless it is younger than _cache_ttl_ms."""
+        now = _ticks_ms()
+        if self._read_ms is None or _ticks_diff(now, self._read_ms) >= self._cache_ttl_ms:
+            self._x, self._y, self._z = self._read_raw()
+            self._read_ms = now
 
     def get_x(self) -> int:
         """
@@ -395,7 +498,7 @@ class Accelerometer:
         Returns:
             Acceleration value in mg, typically -2000 to +2000
         """
-        self._x, self._y, self._z = self._read_raw()
+        self._maybe_read()
         return self._x - self._offset_x
 
     def get_y(self) -> int:
@@ -405,7 +508,7 @@ class Accelerometer:
         Returns:
             Acceleration value in mg, typically -2000 to +2000
         """
-        self._x, self._y, self._z = self._read_raw()
+        self._maybe_read()
         return self._y - self._offset_y
 
     def get_z(self) -> int:
@@ -415,7 +518,7 @@ class Accelerometer:
         Returns:
             Acceleration value in mg, typically -2000 to +2000
         """
-        self._x, self._y, self._z = self._read_raw()
+        self._maybe_read()
         return self._z - self._offset_z
 
     def get_values(self) -> tuple[int, int, int]:
@@ -425,7 +528,7 @@ class Accelerometer:
         Returns:
             Tuple of (x, y, z) acceleration values in mg
         """
-        self._x, self._y, self._z = self._read_raw()
+        self._maybe_read()
         return (
             self._x - self._offset_x,
             self._y - self._offset_y,
@@ -440,18 +543,22 @@ class Accelerometer:
         # Take multiple samples and average
         samples = 10
         sum_x, sum_y, sum_z = 0, 0, 0
+        read_raw = self._read_raw
         
-        for _ in range(samples):
-            x, y, z = self._read_raw()
+        for i in range(samples):
+            if i:
+                # Only wait as long as the IMU needs to produce a new sample
+                _sleep_ms(self._sample_ms)
+            x, y, z = read_raw()
             sum_x += x
             sum_y += y
             sum_z += z
-            _sleep_ms(10)
         
         self._offset_x = sum_x // samples
         self._offset_y = sum_y // samples
         self._offset_z = sum_z // samples - 1000  # Assume gravity on Z axis
 
+    @micropython.native
     def was_shaken(self) -> bool:
         """
         Check if the device was shaken since the last call.
@@ -460,32 +567,30 @@ class Accelerometer:
         Once a shake is detected, it returns True until the next call, then resets.
         This allows for event-driven programming patterns.
         
+        With the BNO055 shake interrupt enabled (shake_interrupt is True), the
+        sensor flags shakes itself and this call does no I2C reads until one
+        happens.
+        
         Returns:
             True if a shake was detected since last call, False otherwise
         """
-        # Read current acceleration values
-        x, y, z = self.get_values()
+        if self.shake_interrupt:
+            return self._take_shake_interrupt()
         
-        # Calculate acceleration magnitude (total acceleration vector length)
-        # Using integer math to avoid floating point operations
-        magnitude_squared = x * x + y * y + z * z
+        # Read current acceleration values (no tuple, unlike get_values())
+        self._maybe_read()
         
-        # Compare against threshold squared (avoid sqrt for performance)
-        threshold_squared = self._shake_threshold * self._shake_threshold
-        
-        # Get current time for debouncing
-        if hasattr(_time, "ticks_ms"):
-            current_time = _time.ticks_ms()  # type: ignore[attr-defined]
-        else:
-            current_time = int(_time.time() * 1000)
-        
-        # Check if acceleration exceeds threshold and debounce period has passed
-        if magnitude_squared > threshold_squared:
+        # Compare the squared acceleration magnitude against the squared
+        # threshold: integer math only, no sqrt
+        if _over_threshold(
+            self._x - self._offset_x,
+            self._y - self._offset_y,
+            self._z - self._offset_z,
+            self._shake_threshold_sq,
+        ):
             # Check debounce - only detect new shake if enough time has passed
-            if hasattr(_time, "ticks_diff"):
-                time_since_last = _time.ticks_diff(current_time, self._last_shake_time)  # type: ignore[attr-defined]
-            else:
-                time_since_last = current_time - self._last_shake_time
+            current_time = _ticks_ms()
+            time_since_last = _ticks_diff(current_time, self._last_shake_time)
             
             if time_since_last >= self._shake_debounce_ms:
                 self._shake_detected = True
@@ -496,16 +601,44 @@ class Accelerometer:
         self._shake_detected = False
         return result
 
+    def _take_shake_interrupt(self) -> bool:
+        """Consume the INT flag, re-arming the BNO055's latched INT pin."""
+        if not self._int_flag:
+            return False
+        self._int_flag = False
+        self._i2c.writeto_mem(self._addr, _BNO055_REG_SYS_TRIGGER, bytes([_BNO055_SYS_TRIGGER_RST_INT]))
+        
+        current_time = _ticks_ms()
+        time_since_last = _ticks_diff(current_time, self._last_shake_time)
+        if time_since_last < self._shake_debounce_ms:
+            return False
+        self._last_shake_time = current_time
+        return True
+
     def set_shake_threshold(self, threshold_mg: int) -> None:
         """
         Set the shake detection threshold.
         
+        When polling, the threshold applies to the magnitude of the
+        (offset-corrected) acceleration vector. With the BNO055 shake
+        interrupt (shake_interrupt is True) the sensor compares each axis
+        on its own, so a shake has to exceed the threshold along a single
+        axis and diagonal shakes need to be somewhat stronger.
+        
         Args:
             threshold_mg: Acceleration threshold in milli-g (mg). 
                          Higher values require stronger shakes to trigger.
                          Default is 1500 mg.
         """
         self._shake_threshold = threshold_mg
+        self._shake_threshold_sq = threshold_mg * threshold_mg
+        if self.shake_interrupt:
+            # Interrupt registers can only be written in config mode
+            self._i2c.writeto_mem(self._addr, _BNO055_REG_OPR_MODE, bytes([_BNO055_OPERATION_MODE_CONFIG]))
+            _sleep_ms(25)
+            self._config_bno055_shake_int()
+            self._i2c.writeto_mem(self._addr, _BNO055_REG_OPR_MODE, bytes([_BNO055_OPERATION_MODE_NDOF]))
+            _sleep_ms(20)
 
 
 def on_shake(callback, threshold_mg: int = 1500):
@@ -514,7 +647,9 @@ def on_shake(callback, threshold_mg: int = 1500):
     
     This function continuously monitors the accelerometer and calls the callback
     whenever a shake is detected. It runs in a loop, so it should be used as
-    an entry point in your program.
+    an entry point in your program. If the accelerometer was created with
+    use_shake_interrupt=True and the BNO055 interrupt is working, the loop
+    idles until the sensor signals a shake instead of polling it.
     
     Button event handlers (on_button_pressed) work alongside this function
     because they use GPIO interrupts which run asynchronously. However, if you
@@ -586,17 +721,25 @@ def on_shake(callback, threshold_mg: int = 1500):
     if threshold_mg != 1500:
         acc.set_shake_threshold(threshold_mg)
     
+    # Bind once; the loop below runs forever
+    was_shaken = acc.was_shaken
+    use_interrupt = acc.shake_interrupt
+    
     # Continuous monitoring loop
     while True:
-        if acc.was_shaken():
+        if was_shaken():
             try:
                 callback()
             except Exception as e:
                 # Don't let callback errors break the shake detection
                 print(f"Error in shake callback: {e}")
         
-        # Small delay to avoid excessive CPU usage
-        _sleep_ms(50)
+        if use_interrupt:
+            # The IMU's INT pin flags shakes; sleep until any interrupt
+            _idle()
+        else:
+            # Small delay to avoid excessive CPU usage
+            _sleep_ms(50)
 
 
 __all__ = ["Accelerometer", "on_shake"]
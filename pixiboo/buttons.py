@@ -2,31 +2,47 @@
 Debounced access to Pixiboo buttons.
 """
 
+from array import array
+
 from .hardware import BUTTON_LEFT, BUTTON_CENTER, BUTTON_RIGHT
 
+try:
+    import micropython
+    from micropython import const, schedule as _schedule
+except ImportError:  # pragma: no cover - host fallback
+    class micropython:  # type: ignore
+        @staticmethod
+        def native(func):
+            return func
+
+    def const(value):
+        return value
+
+    def _schedule(func, arg):
+        func(arg)
+
 
 class Button:
     """Button constants for event handlers."""
-    LEFT = "left"
-    CENTER = "center"
-    RIGHT = "right"
+    LEFT = const(0)
+    CENTER = const(1)
+    RIGHT = const(2)
+
+
+# Button index for each accepted identifier; the public API also takes names
+_BUTTON_INDEX = {
+    "left": Button.LEFT,
+    "center": Button.CENTER,
+    "right": Button.RIGHT,
+    Button.LEFT: Button.LEFT,
+    Button.CENTER: Button.CENTER,
+    Button.RIGHT: Button.RIGHT,
+}
 
 try:
     from machine import Pin
 except ImportError:  # pragma: no cover - host fallback
-    class Pin:  # type: ignore
-        IN = 0
-        PULL_UP = 2
-        IRQ_FALLING = 2
-
-        def __init__(self, *_, **__):
-            pass
-
-        def value(self):
-            return 1
-        
-        def irq(self, *_, **__):
-            pass
+    from ._fallback import Pin
 
 try:
     import utime as _time
@@ -34,16 +50,17 @@ except ImportError:  # pragma: no cover
     import time as _time
 
 
-def _ticks_ms() -> int:
-    if hasattr(_time, "ticks_ms"):
-        return _time.ticks_ms()  # type: ignore[attr-defined]
-    return int(_time.time() * 1000)
+# Resolved once at import; the IRQ handler calls these on every press
+if hasattr(_time, "ticks_ms"):
+    _ticks_ms = _time.ticks_ms  # type: ignore[attr-defined]
+    _ticks_diff = _time.ticks_diff  # type: ignore[attr-defined]
+else:  # pragma: no cover
+    # Wrap like utime's 30-bit ticks so stamps fit the array('i') below
+    def _ticks_ms() -> int:
+        return int(_time.time() * 1000) & 0x3FFFFFFF
 
-
-def _ticks_diff(a: int, b: int) -> int:
-    if hasattr(_time, "ticks_diff"):
-        return _time.ticks_diff(a, b)  # type: ignore[attr-defined]
-    return a - b
+    def _ticks_diff(a: int, b: int) -> int:
+        return ((a - b + 0x20000000) & 0x3FFFFFFF) - 0x20000000
 
 
 class Buttons:
@@ -52,61 +69,66 @@ class Buttons:
         Initialize button handling.
         
         Args:
-            debounce_ms: Debounce time in milliseconds (default 50ms)
+            debounce_ms: Debounce time in milliseconds for interrupt callbacks (default 50ms)
             auto_update: Automatically use interrupts for callbacks (default True)
         """
         self.debounce_ms = debounce_ms
         self.auto_update = auto_update
-        self._pins = {
-            "left": Pin(BUTTON_LEFT, Pin.IN, Pin.PULL_UP),
-            "center": Pin(BUTTON_CENTER, Pin.IN, Pin.PULL_UP),
-            "right": Pin(BUTTON_RIGHT, Pin.IN, Pin.PULL_UP),
-        }
-        self._last_state = {name: pin.value() for name, pin in self._pins.items()}
+        # Indexed by Button.LEFT/CENTER/RIGHT, like all per-button state
+        self._pins = (
+            Pin(BUTTON_LEFT, Pin.IN, Pin.PULL_UP),
+            Pin(BUTTON_CENTER, Pin.IN, Pin.PULL_UP),
+            Pin(BUTTON_RIGHT, Pin.IN, Pin.PULL_UP),
+        )
+        # Recent samples per button, newest in bit 0 (1 = released)
+        self._hist = bytearray(0xFF if pin.value() else 0x00 for pin in self._pins)
         now = _ticks_ms()
-        self._last_time = {name: now for name in self._pins}
-        self._callbacks = {name: [] for name in self._pins}
+        # Interrupt debounce timestamps, indexed by Button.LEFT/CENTER/RIGHT
+        self._irq_time = array("i", (now, now, now))
+        # One callback list per button, indexed by Button.LEFT/CENTER/RIGHT
+        self._callbacks = ([], [], [])
         self._irq_enabled = False
 
-    def _pressed(self, name: str) -> bool:
-        pin = self._pins[name]
-        value = pin.value()
-        now = _ticks_ms()
-        if (
-            value == 0
-            and self._last_state[name] == 1
-            and _ticks_diff(now, self._last_time[name]) >= self.debounce_ms
-        ):
-            self._last_state[name] = value
-            self._last_time[name] = now
-            return True
-        self._last_state[name] = value
-        self._last_time[name] = now
-        return False
+    @micropython.native
+    def _pressed(self, idx: int) -> bool:
+        # Shift in a new sample. A press is one released sample followed by
+        # two pressed ones, so a bounce lasting a single sample is ignored.
+        hist = ((self._hist[idx] << 1) | self._pins[idx].value()) & 0xFF
+        self._hist[idx] = hist
+        return (hist & 0x07) == 0x04
 
     def left_pressed(self) -> bool:
-        return self._pressed("left")
+        return self._pressed(Button.LEFT)
 
     def center_pressed(self) -> bool:
-        return self._pressed("center")
+        return self._pressed(Button.CENTER)
 
     def right_pressed(self) -> bool:
-        return self._pressed("right")
+        return self._pressed(Button.RIGHT)
+
+    @property
+    def irq_enabled(self) -> bool:
+        """
+        True once button interrupts are running, so registered callbacks
+        fire on their own; False means presses have to be polled.
+        """
+        return self._irq_enabled
 
     def is_pressed(self, button: str) -> bool:
         """
         Check if a button is currently pressed (not debounced, immediate state).
         
         Args:
-            button: Button name ("left", "center", or "right"), or Button.LEFT, Button.CENTER, Button.RIGHT
+            button: Button.LEFT, Button.CENTER, Button.RIGHT, or a name ("left", "center", "right")
             
         Returns:
             True if button is currently pressed, False otherwise
         """
-        if button not in self._pins:
+        idx = _BUTTON_INDEX.get(button)
+        if idx is None:
             return False
         # In pull-up configuration, pressed = 0, not pressed = 1
-        return self._pins[button].value() == 0
+        return self._pins[idx].value() == 0
 
     def on_button_pressed(self, button: str, callback):
         """
@@ -115,7 +137,7 @@ class Buttons:
         Callbacks are automatically triggered using GPIO interrupts.
         
         Args:
-            button: Button name ("left", "center", or "right"), or Button.LEFT, Button.CENTER, Button.RIGHT
+            button: Button.LEFT, Button.CENTER, Button.RIGHT, or a name ("left", "center", "right")
             callback: Function to call when button is pressed (takes no arguments)
         
         Example:
@@ -124,9 +146,10 @@ class Buttons:
             
             buttons.on_button_pressed(Button.LEFT, on_left_pressed)
         """
-        if button not in self._pins:
+        idx = _BUTTON_INDEX.get(button)
+        if idx is None:
             return
-        self._callbacks[button].append(callback)
+        self._callbacks[idx].append(callback)
         
         # Setup GPIO interrupts when first callback is registered
         if self.auto_update and not self._irq_enabled:
@@ -140,33 +163,46 @@ class Buttons:
         try:
             # Setup interrupt for each button
             # Trigger on falling edge (button pressed with pull-up)
-            for name, pin in self._pins.items():
-                pin.irq(trigger=Pin.IRQ_FALLING, handler=self._make_irq_handler(name))
+            for idx, pin in enumerate(self._pins):
+                pin.irq(trigger=Pin.IRQ_FALLING, handler=self._make_irq_handler(idx))
             
             self._irq_enabled = True
         except Exception as e:
             # If interrupts fail, user must call update() manually
             pass
     
-    def _make_irq_handler(self, button_name: str):
+    def _make_irq_handler(self, idx: int):
         """Create an interrupt handler for a specific button."""
+        # Bind once so the handler itself allocates nothing
+        run_callbacks = self._run_callbacks
+        irq_time = self._irq_time
+
+        @micropython.native
         def handler(pin):
             # Simple debounce check
             now = _ticks_ms()
-            if _ticks_diff(now, self._last_time[button_name]) < self.debounce_ms:
+            if _ticks_diff(now, irq_time[idx]) < self.debounce_ms:
                 return  # Too soon, ignore
             
-            self._last_time[button_name] = now
+            irq_time[idx] = now
             
-            # Call all registered callbacks for this button
-            for callback in self._callbacks[button_name]:
-                try:
-                    callback()
-                except Exception as e:
-                    print(f"Error in button callback: {e}")
+            # Run the callbacks outside interrupt context, where they may
+            # allocate memory and print
+            try:
+                _schedule(run_callbacks, idx)
+            except RuntimeError:
+                pass  # Schedule queue full; drop this press
         
         return handler
 
+    def _run_callbacks(self, idx: int) -> None:
+        """Call all registered callbacks for a button (scheduled from the IRQ)."""
+        for callback in self._callbacks[idx]:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in button callback: {e}")
+
     def update(self):
         """
         Check for button presses and call registered callbacks.
@@ -174,10 +210,10 @@ class Buttons:
         Note: If auto_update is enabled (default), this is called automatically
         in the background and you don't need to call it manually.
         """
-        for name in self._pins:
-            if self._pressed(name):
+        for idx in range(len(self._pins)):
+            if self._pressed(idx):
                 # Call all registered callbacks for this button
-                for callback in self._callbacks[name]:
+                for callback in self._callbacks[idx]:
                     try:
                         callback()
                     except Exception:
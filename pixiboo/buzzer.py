@@ -2,28 +2,17 @@
 Simple buzzer wrapper for Pixiboo.
 """
 
-from .hardware import BUZZER_PIN
+from .hardware import BUZZER_PIN, BUZZER_TIMER_ID
 
 try:
-    from machine import Pin, PWM
+    from machine import Pin, PWM, Timer
 except ImportError:  # pragma: no cover - host fallback
-    class Pin:  # type: ignore
-        OUT = 1
+    from ._fallback import Pin, PWM, Timer
 
-        def __init__(self, *_, **__):
-            pass
-
-    class PWM:  # type: ignore
-        def __init__(self, *_args, **__):
-            self._duty = 0
-
-        def duty(self, value=None):
-            if value is not None:
-                self._duty = value
-            return self._duty
-
-        def freq(self, *_args, **__):
-            return None
+try:
+    from array import array
+except ImportError:  # pragma: no cover
+    array = ()  # isinstance(x, ()) is always False
 
 try:
     import utime as _time
@@ -31,41 +20,138 @@ except ImportError:  # pragma: no cover
     import time as _time
 
 
-def _sleep_ms(ms: int) -> None:
-    if hasattr(_time, "sleep_ms"):
-        _time.sleep_ms(ms)  # type: ignore[attr-defined]
-    else:
+try:
+    import uasyncio as _asyncio
+except ImportError:  # pragma: no cover
+    import asyncio as _asyncio
+
+
+# Resolved once at import instead of feature-testing on every note
+if hasattr(_time, "sleep_ms"):
+    _sleep_ms = _time.sleep_ms  # type: ignore[attr-defined]
+else:  # pragma: no cover
+    def _sleep_ms(ms: int) -> None:
         _time.sleep(ms / 1000.0)
 
+if hasattr(_asyncio, "sleep_ms"):
+    _async_sleep_ms = _asyncio.sleep_ms  # type: ignore[attr-defined]
+else:  # pragma: no cover
+    def _async_sleep_ms(ms: int):
+        return _asyncio.sleep(ms / 1000.0)
+
+
+def _notes(melody):
+    """Yield (frequency, duration_ms) for each note of a melody."""
+    if isinstance(melody, array):
+        for i in range(0, len(melody) - 1, 2):
+            yield melody[i], melody[i + 1]
+    else:
+        for note in melody:
+            # Index first; only a bare frequency pays for the exception
+            try:
+                freq, duration = note[0], note[1]
+            except TypeError:
+                freq, duration = note, 250
+            yield freq, duration
+
 
 class Buzzer:
     def __init__(self):
         self._pwm = PWM(Pin(BUZZER_PIN))
+        # 50% duty as a 16-bit value where supported; a fixed 10-bit 512
+        # depends on the port's duty resolution at each frequency
+        if hasattr(self._pwm, "duty_u16"):
+            self._set_duty = self._pwm.duty_u16
+            self._duty_on = 32768
+        else:  # pragma: no cover
+            self._set_duty = self._pwm.duty
+            self._duty_on = 512
+        # Last frequency sent to the PWM, so repeated notes skip freq()
+        self._freq = None
         # Ensure the buzzer is silent immediately after construction.
-        self._pwm.duty(0)
+        self._set_duty(0)
         self._stopped = True
+        # Background playback; the timer is only claimed on first use
+        self._timer = None
+        self._pending = None
+        self._next_note_cb = self._next_note
 
-    def play(self, melody) -> None:
+    def play(self, melody, wait: bool = True) -> None:
         """
         Play a melody defined as [(frequency, duration_ms), ...].
         If an entry is just a frequency, a 250 ms duration is used.
+        
+        A melody can also be an array of interleaved values, e.g.
+        array('H', [440, 200, 523, 200]), which avoids a tuple per note.
+        
+        With wait=False, play() returns at once and a hardware timer moves
+        on to each next note, so the program keeps running while it plays.
         """
+        if self._pending is not None:
+            # Cut off a melody still playing in the background
+            self.stop()
+        if not wait:
+            if self._timer is None:
+                self._timer = Timer(BUZZER_TIMER_ID)
+            self._pending = _notes(melody)
+            self._stopped = False
+            self._next_note(None)
+            return
         self._stopped = False
-        for note in melody:
+        for freq, duration in _notes(melody):
             if self._stopped:
                 break
-            if isinstance(note, (list, tuple)) and len(note) >= 2:
-                freq, duration = note[0], note[1]
-            else:
-                freq, duration = note, 250
-            self._pwm.freq(freq)
-            self._pwm.duty(512)
-            _sleep_ms(int(duration))
+            self._tone(freq, duration)
         self.stop()
 
+    async def play_async(self, melody) -> None:
+        """
+        Play a melody like play(), but await between notes.
+        
+        The tone keeps sounding from the PWM hardware while other asyncio
+        tasks run, e.g. `await b.play_async(melody)`.
+        """
+        if self._pending is not None:
+            # Cut off a melody still playing in the background
+            self.stop()
+        self._stopped = False
+        for freq, duration in _notes(melody):
+            if self._stopped:
+                break
+            self._start_tone(freq)
+            await _async_sleep_ms(int(duration))
+        self.stop()
+
+    def _next_note(self, _timer) -> None:
+        # Timer callback: start the next note and arm the timer for its end
+        if self._stopped:
+            return
+        try:
+            freq, duration = next(self._pending)
+        except StopIteration:
+            self.stop()
+            return
+        self._start_tone(freq)
+        # A zero period isn't a valid one-shot; treat it as the shortest note
+        self._timer.init(mode=Timer.ONE_SHOT, period=max(1, int(duration)),
+                         callback=self._next_note_cb)
+
+    def _start_tone(self, freq) -> None:
+        if freq != self._freq:
+            self._pwm.freq(freq)
+            self._freq = freq
+        self._set_duty(self._duty_on)
+
+    def _tone(self, freq, duration) -> None:
+        self._start_tone(freq)
+        _sleep_ms(int(duration))
+
     def stop(self) -> None:
         self._stopped = True
-        self._pwm.duty(0)
+        if self._timer is not None:
+            self._timer.deinit()
+        self._pending = None
+        self._set_duty(0)
 
 
 __all__ = ["Buzzer"]
@@ -422,6 +422,42 @@ FONT_7x7 = {
 }
 
 
+# Packed copy of FONT_7x7: 7 bytes per glyph (one per row, bit 6 is the
+# leftmost column), indexed by ord(char) - FONT_FIRST. Characters without a
+# glyph stay all zero, so they render blank like get_char_pattern() does.
+FONT_FIRST = 32  # ' '
+FONT_LAST = 95  # '_'
+
+
+def _pack_font() -> bytes:
+    table = bytearray(7 * (FONT_LAST - FONT_FIRST + 1))
+    for char, pattern in FONT_7x7.items():
+        base = (ord(char) - FONT_FIRST) * 7
+        for y, row in enumerate(pattern):
+            table[base + y] = int(row, 2)
+    return bytes(table)
+
+
+FONT_BYTES = _pack_font()
+_FONT_VIEW = memoryview(FONT_BYTES)
+
+
+def get_char_bitmap(char: str):
+    """
+    Get the packed 7x7 bitmap for a character.
+    
+    Args:
+        char: Single character (will be converted to uppercase)
+    
+    Returns:
+        memoryview of 7 row bytes; bit 6 of each byte is the leftmost pixel
+    """
+    index = ord(char.upper()) - FONT_FIRST
+    if index < 0 or index > FONT_LAST - FONT_FIRST:
+        index = 0  # Space
+    return _FONT_VIEW[index * 7:index * 7 + 7]
+
+
 def get_char_pattern(char: str):
     """
     Get the 7x7 pattern for a character.
@@ -442,4 +478,4 @@ def get_char_pattern(char: str):
     return pattern
 
 
-__all__ = ["get_char_pattern", "FONT_7x7"]
+__all__ = ["get_char_pattern", "get_char_bitmap", "FONT_7x7", "FONT_BYTES"]
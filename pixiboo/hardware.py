@@ -4,24 +4,31 @@ Hardware constants for the Pixiboo board.
 Keep all pin knowledge in one place; no logic here.
 """
 
-LED_PIN = 18
-NUM_LEDS = 49
+try:
+    from micropython import const
+except ImportError:  # pragma: no cover - host fallback
+    def const(value):
+        return value
 
-BUTTON_LEFT = 12
-BUTTON_CENTER = 11
-BUTTON_RIGHT = 13
+LED_PIN = const(18)
+NUM_LEDS = const(49)
 
-BUZZER_PIN = 38
+BUTTON_LEFT = const(12)
+BUTTON_CENTER = const(11)
+BUTTON_RIGHT = const(13)
 
-EYE_LEFT_PIN = 21
-EYE_RIGHT_PIN = 14
+BUZZER_PIN = const(38)
+BUZZER_TIMER_ID = const(1)  # Hardware timer for background melodies
+
+EYE_LEFT_PIN = const(21)
+EYE_RIGHT_PIN = const(14)
 
 # I2C pins for external IMU
-I2C_SCL_PIN = 15
-I2C_SDA_PIN = 16
-IMU_RESET_PIN = 48
-IMU_INTERRUPT_PIN = 47
-IMU_ADDRESS_SELECT_PIN = 45
+I2C_SCL_PIN = const(15)
+I2C_SDA_PIN = const(16)
+IMU_RESET_PIN = const(48)
+IMU_INTERRUPT_PIN = const(47)
+IMU_ADDRESS_SELECT_PIN = const(45)
 
 __all__ = [
     "LED_PIN",
@@ -30,6 +37,7 @@ __all__ = [
     "BUTTON_CENTER",
     "BUTTON_RIGHT",
     "BUZZER_PIN",
+    "BUZZER_TIMER_ID",
     "EYE_LEFT_PIN",
     "EYE_RIGHT_PIN",
     "I2C_SCL_PIN",
@@ -9,18 +9,7 @@ from .hardware import LIGHT_SENSOR_PIN
 try:
     from machine import ADC, Pin
 except ImportError:  # pragma: no cover - host fallback
-    class Pin:  # type: ignore
-        pass
-
-    class ADC:  # type: ignore
-        def __init__(self, *_args, **__):
-            self._value = 2048  # Simulate mid-range value
-
-        def read(self):
-            return self._value
-
-        def read_u16(self):
-            return self._value << 4  # Convert to 16-bit range
+    from ._fallback import ADC, Pin
 
 
 class LightSensor:
@@ -42,14 +31,19 @@ class LightSensor:
         """
         return self._adc.read()
 
-    def read_percent(self) -> float:
+    def read_percent(self, raw: int = None) -> float:
         """
         Read the current light level as a percentage.
         
+        Args:
+            raw: A value already returned by read(); if omitted, a new
+                 sample is taken
+        
         Returns:
             float: Light level from 0.0 (dark) to 100.0 (bright)
         """
-        raw = self.read()
+        if raw is None:
+            raw = self.read()
         return (raw / 4095.0) * 100.0
 
 
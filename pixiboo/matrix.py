@@ -4,61 +4,41 @@ Friendly 7x7 matrix wrapper for the Pixiboo board.
 
 from .colors import BLACK, RED
 from .hardware import LED_PIN, NUM_LEDS
-from .font import get_char_pattern
+from .font import get_char_bitmap
 
 try:
     from machine import Pin
-    import neopixel
+    from neopixel import NeoPixel
 except ImportError:  # pragma: no cover - host fallback
-    class Pin:  # type: ignore
-        IN = 0
-        OUT = 1
-        PULL_UP = 2
-
-        def __init__(self, *_, **__):
-            pass
-
-        def value(self):
-            return 1
-
-    class _DummyNeoPixel:
-        def __init__(self, *_args):
-            self._buf = [(0, 0, 0)] * NUM_LEDS
-
-        def __setitem__(self, idx, color):
-            if 0 <= idx < len(self._buf):
-                self._buf[idx] = color
-
-        def write(self):
-            pass
-
-    class _DummyNeoModule:
-        NeoPixel = _DummyNeoPixel
-
-    neopixel = _DummyNeoModule()  # type: ignore
+    from ._fallback import Pin, NeoPixel
 
 try:
     import utime as _time
 except ImportError:  # pragma: no cover
     import time as _time
 
+from array import array
 
-def _ticks_ms() -> int:
-    if hasattr(_time, "ticks_ms"):
-        return _time.ticks_ms()  # type: ignore[attr-defined]
-    return int(_time.time() * 1000)
+try:
+    import micropython
+    from micropython import const
+except ImportError:  # pragma: no cover - host fallback
+    class micropython:  # type: ignore
+        @staticmethod
+        def native(func):
+            return func
 
+    def const(value):
+        return value
 
-def _ticks_diff(a: int, b: int) -> int:
-    if hasattr(_time, "ticks_diff"):
-        return _time.ticks_diff(a, b)  # type: ignore[attr-defined]
-    return a - b
+import sys
 
 
-def _sleep_ms(ms: int) -> None:
-    if hasattr(_time, "sleep_ms"):
-        _time.sleep_ms(ms)  # type: ignore[attr-defined]
-    else:
+# Resolved once at import instead of feature-testing on every call
+if hasattr(_time, "sleep_ms"):
+    _sleep_ms = _time.sleep_ms  # type: ignore[attr-defined]
+else:  # pragma: no cover
+    def _sleep_ms(ms: int) -> None:
         _time.sleep(ms / 1000.0)
 
 
@@ -77,6 +57,85 @@ def _clamp(value: float, low: float = 0.0, high: float = 1.0) -> float:
 _default_brightness = 0.8
 _hardware_brightness_cap = 0.25  # Cap hardware at 25% to protect LEDs
 
+# Local mirror of NUM_LEDS; const() only inlines inside its own module
+_NUM_LEDS = const(49)
+# Bytes in one frame: 7x7 pixels, 3 channels each
+_FRAME_BYTES = const(_NUM_LEDS * 3)
+
+# One pixel of BLACK as packed RGB, for bulk writes into the frame buffer
+_BLACK_BYTES = bytes(BLACK)
+# A whole frame of BLACK, for clearing the buffer in one slice copy
+_BLACK_FRAME = _BLACK_BYTES * _NUM_LEDS
+
+
+def _channel(value) -> int:
+    # Colors may carry floats or out-of-range values; store a valid byte
+    value = int(value)
+    if value < 0:
+        return 0
+    if value > 255:
+        return 255
+    return value
+
+
+def _color_into(color, out, off: int) -> None:
+    # Pack a color as 3 RGB bytes at out[off]; a 4-tuple's per-pixel
+    # brightness is folded into the channels here, so the frame buffer
+    # only holds RGB
+    if len(color) == 4:
+        scale = _clamp(color[3])
+        out[off] = _channel(color[0] * scale)
+        out[off + 1] = _channel(color[1] * scale)
+        out[off + 2] = _channel(color[2] * scale)
+    else:
+        out[off] = _channel(color[0])
+        out[off + 1] = _channel(color[1])
+        out[off + 2] = _channel(color[2])
+
+
+def _color_bytes(color) -> bytearray:
+    # One packed pixel, for repeating across a row or the whole frame
+    out = bytearray(3)
+    _color_into(color, out, 0)
+    return out
+
+
+# Compiled tuple sprites, keyed by id(); tuples can't change after compiling.
+# Each entry holds its sprite so the id stays valid, and the cache is
+# emptied when full so sprites built at runtime can't pile up on the heap.
+_SPRITE_CACHE_SIZE = const(8)
+_sprite_cache = {}
+
+
+def _compile_sprite(sprite):
+    # Turn "1"/"0" rows into (width, row bitmasks); the leftmost column is
+    # the highest bit of each mask
+    width = len(sprite[0]) if sprite else 0
+    masks = []
+    for row in sprite:
+        bits = 0
+        for ch in row:
+            bits = (bits << 1) | (ch == "1")
+        masks.append(bits)
+    return width, tuple(masks)
+
+
+# Viper loops don't check for pending interrupts or scheduled callbacks;
+# one frame is only 147 bytes, so the pause is a few microseconds.
+if sys.implementation.name == "micropython":
+    @micropython.viper
+    def _blit(src: ptr8, dst: ptr8, offs: ptr16, lut: ptr8):
+        # Scale every frame byte through the brightness table into its
+        # slot in the NeoPixel buffer
+        i = 0
+        while i < _FRAME_BYTES:
+            dst[offs[i]] = lut[src[i]]
+            i += 1
+else:  # pragma: no cover - host fallback
+    def _blit(src, dst, offs, lut):
+        for i in range(_FRAME_BYTES):
+            dst[offs[i]] = lut[src[i]]
+
 
 class _RowProxy:
     """
@@ -102,107 +161,260 @@ class _NullRow:
         return None
 
 
+# Stateless, so every matrix shares one for out-of-range rows
+_NULL_ROW = _NullRow()
+
+
 class Matrix:
     WIDTH = 7
     HEIGHT = 7
     _instances = []
 
     def __init__(self):
-        self._m = [[BLACK for _ in range(self.WIDTH)] for _ in range(self.HEIGHT)]
+        # Packed RGB before brightness, 3 bytes per pixel, row-major
+        self._buf = bytearray(_BLACK_BYTES * (self.WIDTH * self.HEIGHT))
+        # LED index for each pixel, row-major (y * WIDTH + x). Hardware is
+        # wired right-to-left; mirror the X axis so m[row][column] matches
+        # visual left-to-right.
+        self._phys_index = tuple(
+            (NUM_LEDS - 1) - (y * self.WIDTH + (self.WIDTH - 1) - x)
+            for y in range(self.HEIGHT)
+            for x in range(self.WIDTH)
+        )
+        # Channel value -> scaled output, rebuilt whenever brightness changes
+        self._bright_lut = bytearray(256)
+        # One proxy per row, reused by every m[row] lookup
+        self._rows = tuple(_RowProxy(self, y) for y in range(self.HEIGHT))
+        # Character -> flattened 49-byte on/off mask, filled by display()
+        self._glyph_cache = {}
+        # Nothing has reached the LEDs yet, so the whole matrix starts dirty
+        self._dirty = True
         self.brightness = _default_brightness
-        self._np = neopixel.NeoPixel(Pin(LED_PIN), NUM_LEDS)
+        self._np = NeoPixel(Pin(LED_PIN), NUM_LEDS)
+        # show() renders straight into the driver's own buffer. A driver
+        # without one gets a local RGB batch that is copied in per LED.
+        self._out = getattr(self._np, "buf", None)
+        if self._out is None:
+            self._out = bytearray(NUM_LEDS * 3)
+            bpp, order = 3, (0, 1, 2)
+        else:
+            bpp, order = self._np.bpp, self._np.ORDER
+        # Where each frame byte lands in the output buffer
+        self._offs = array("H", (
+            self._phys_index[i // 3] * bpp + order[i % 3]
+            for i in range(_FRAME_BYTES)
+        ))
         self._instances.append(self)
 
     def __getitem__(self, y: int):
         """
         Row-first indexing: m[row][column].
+        
+        Reading a pixel returns the color as stored: an (R, G, B) tuple
+        with each channel clamped to 0-255, and a 4-tuple's per-pixel
+        brightness already applied.
         """
         if 0 <= y < self.HEIGHT:
-            return _RowProxy(self, y)
-        return _NullRow()
+            return self._rows[y]
+        return _NULL_ROW
 
     def __setitem__(self, y: int, value):
         # Allow m[row] = color to fill a row
+        self.fill_row(y, value)
+
+    def fill_row(self, y: int, color) -> None:
+        """
+        Set every pixel in one row to a color. Call show() to display it.
+        
+        Args:
+            y: Row number (0 is the top row)
+            color: Color to fill the row with
+        """
         if 0 <= y < self.HEIGHT:
-            for x in range(self.WIDTH):
-                self._set_pixel(x, y, value)
+            o = y * self.WIDTH * 3
+            self._buf[o:o + self.WIDTH * 3] = _color_bytes(color) * self.WIDTH
+            self._dirty = True
 
     def _get_pixel(self, x: int, y: int):
         if 0 <= x < self.WIDTH and 0 <= y < self.HEIGHT:
-            return self._m[y][x]
+            buf = self._buf
+            o = (y * self.WIDTH + x) * 3
+            return (buf[o], buf[o + 1], buf[o + 2])
         return BLACK
 
     def _set_pixel(self, x: int, y: int, color) -> None:
         if 0 <= x < self.WIDTH and 0 <= y < self.HEIGHT:
-            self._m[y][x] = color
+            self._set_pixel_unchecked(x, y, color)
 
-    def _apply_brightness(self, color):
+    def _set_pixel_unchecked(self, x: int, y: int, color) -> None:
+        # Caller guarantees x and y are on the matrix
+        _color_into(color, self._buf, (y * self.WIDTH + x) * 3)
+        self._dirty = True
+
+    def _rebuild_lut(self) -> None:
         # Scale user brightness (0.0-1.0) to hardware brightness (0.0-0.25 max)
         # This protects the LEDs by capping at 25% hardware brightness
-        hardware_brightness = self.brightness * _hardware_brightness_cap
-        
-        # Support both 3-tuple (R, G, B) and 4-tuple (R, G, B, per_pixel_brightness)
-        if len(color) == 4:
-            r, g, b, per_pixel_brightness = color
-            # Apply per-pixel brightness multiplier, then global brightness
-            pixel_brightness = hardware_brightness * _clamp(per_pixel_brightness, 0.0, 1.0)
-            return (int(r * pixel_brightness), int(g * pixel_brightness), int(b * pixel_brightness))
-        else:
-            # Standard 3-tuple: apply global brightness only
-            return tuple(int(channel * hardware_brightness) for channel in color)
+        hardware_brightness = self._brightness * _hardware_brightness_cap
+        lut = self._bright_lut
+        for i in range(256):
+            lut[i] = int(i * hardware_brightness)
 
+    @micropython.native
     def show(self) -> None:
         """
         Push the current buffer to the physical matrix.
+        
+        Does nothing if no pixel or brightness changed since the last
+        show(); use flush() to resend the frame anyway.
         """
-        for y in range(self.HEIGHT):
-            for x in range(self.WIDTH):
-                # Hardware is wired right-to-left; mirror the X axis so
-                # m[row][column] matches visual left-to-right.
-                x_hw = (self.WIDTH - 1) - x
-                logical = y * self.WIDTH + x_hw
-                physical = (NUM_LEDS - 1) - logical
-                self._np[physical] = self._apply_brightness(self._m[y][x])
-        self._np.write()
+        if not self._dirty:
+            return
+        np = self._np
+        out = self._out
+        # The whole frame in one pass; no per-pixel calls into the driver
+        _blit(self._buf, out, self._offs, self._bright_lut)
+        if out is not getattr(np, "buf", None):
+            for i in range(_NUM_LEDS):
+                o = i * 3
+                np[i] = (out[o], out[o + 1], out[o + 2])
+        np.write()
+        self._dirty = False
+
+    def flush(self) -> None:
+        """
+        Resend the whole frame to the matrix, even if nothing changed.
+        """
+        self._dirty = True
+        self.show()
 
     def clear(self) -> None:
         self.fill(BLACK)
 
+    @micropython.native
     def fill(self, color) -> None:
-        for y in range(self.HEIGHT):
-            for x in range(self.WIDTH):
-                self._m[y][x] = color
+        buf = self._buf
+        _color_into(color, buf, 0)
+        # Copy the filled prefix onto itself, doubling it each pass, so the
+        # frame fills in a handful of slice copies without a temporary
+        n = 3
+        total = len(buf)
+        while n * 2 <= total:
+            buf[n:n * 2] = buf[0:n]
+            n *= 2
+        buf[n:total] = buf[0:total - n]
+        self._dirty = True
+        self.show()
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color) -> None:
+        """
+        Fill a rectangle of pixels with one color.
+        
+        Args:
+            x: Left column of the rectangle
+            y: Top row of the rectangle
+            width: Number of columns to fill
+            height: Number of rows to fill
+            color: Color to fill with
+        
+        Example:
+            m.fill_rect(0, 0, 3, 7, RED)  # Left three columns red
+        """
+        # Clip to the matrix so the inner loop needs no bounds checks
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + width, self.WIDTH)
+        y1 = min(y + height, self.HEIGHT)
+        if x0 < x1:
+            buf = self._buf
+            width3 = self.WIDTH * 3
+            span = _color_bytes(color) * (x1 - x0)
+            n = len(span)
+            for o in range(y0 * width3 + x0 * 3, y1 * width3, width3):
+                buf[o:o + n] = span
+        if x0 < x1 and y0 < y1:
+            self._dirty = True
+        self.show()
+
+    def set_pixel_exclusive(self, x: int, y: int, color) -> None:
+        """
+        Light a single pixel and turn every other pixel off, then show it.
+        
+        The buffer is cleared with one slice copy and the whole frame is
+        sent in a single write, so moving one dot around is one show().
+        
+        Args:
+            x: Column of the pixel (0 is the left column)
+            y: Row of the pixel (0 is the top row)
+            color: Color of the pixel
+        
+        Example:
+            m.set_pixel_exclusive(3, 3, GREEN)  # Only the center pixel lit
+        """
+        self._buf[:] = _BLACK_FRAME
+        self._dirty = True
+        self._set_pixel(x, y, color)
         self.show()
 
     def draw(self, sprite, color=RED) -> None:
         # Centered draw; sprites are expected to be 7x7.
-        sprite_height = len(sprite)
-        sprite_width = len(sprite[0]) if sprite else 0
-        offset_y = (self.HEIGHT - sprite_height) // 2
+        if isinstance(sprite, tuple):
+            entry = _sprite_cache.get(id(sprite))
+            if entry is None:
+                if len(_sprite_cache) >= _SPRITE_CACHE_SIZE:
+                    _sprite_cache.clear()
+                entry = (sprite, _compile_sprite(sprite))
+                _sprite_cache[id(sprite)] = entry
+            sprite_width, masks = entry[1]
+        else:
+            # Lists can be edited between draws, so compile them every time
+            sprite_width, masks = _compile_sprite(sprite)
+        offset_y = (self.HEIGHT - len(masks)) // 2
         offset_x = (self.WIDTH - sprite_width) // 2
-
-        for sy, row in enumerate(sprite):
-            for sx, ch in enumerate(row):
-                if ch == "1":
-                    self._set_pixel(offset_x + sx, offset_y + sy, color)
+        # Clip oversized sprites once so the loop needs no bounds checks
+        sx0 = max(0, -offset_x)
+        sx1 = min(sprite_width, self.WIDTH - offset_x)
+        sy0 = max(0, -offset_y)
+        sy1 = min(len(masks), self.HEIGHT - offset_y)
+
+        set_pixel = self._set_pixel_unchecked
+        top_bit = sprite_width - 1
+        for sy in range(sy0, sy1):
+            bits = masks[sy]
+            y = offset_y + sy
+            for sx in range(sx0, sx1):
+                if (bits >> (top_bit - sx)) & 1:
+                    set_pixel(offset_x + sx, y, color)
                 else:
-                    self._set_pixel(offset_x + sx, offset_y + sy, BLACK)
+                    set_pixel(offset_x + sx, y, BLACK)
         self.show()
 
+    @micropython.native
     def scroll_left(self, delay: int = 100) -> None:
-        for y in range(self.HEIGHT):
-            row = self._m[y]
-            row.pop(0)
-            row.append(BLACK)
+        buf = self._buf
+        n = len(buf)
+        # Shift the whole frame one pixel left in one copy; each row's first
+        # pixel lands in the row above, where the right column is blanked
+        buf[0:n - 3] = buf[3:n]
+        black = _BLACK_BYTES
+        stride = self.WIDTH * 3
+        for o in range(stride - 3, n, stride):
+            buf[o:o + 3] = black
+        self._dirty = True
         self.show()
         if delay:
             _sleep_ms(delay)
 
+    @micropython.native
     def scroll_right(self, delay: int = 100) -> None:
-        for y in range(self.HEIGHT):
-            row = self._m[y]
-            row.insert(0, BLACK)
-            row.pop()
+        buf = self._buf
+        n = len(buf)
+        # Mirror of scroll_left: one copy, then blank the left column
+        buf[3:n] = buf[0:n - 3]
+        black = _BLACK_BYTES
+        stride = self.WIDTH * 3
+        for o in range(0, n, stride):
+            buf[o:o + 3] = black
+        self._dirty = True
         self.show()
         if delay:
             _sleep_ms(delay)
@@ -220,17 +432,32 @@ class Matrix:
         Example:
             m.display("HELLO")  # Shows H, then E, then L, then L, then O
         """
+        on = _color_bytes(color)
+        cache = self._glyph_cache
+        # Render every distinct character up front, so the loop below only
+        # copies a finished frame between waits
+        frames = {}
+        for char in text:
+            if char in frames:
+                continue
+            # Get the character mask (7x7, uses full matrix)
+            mask = cache.get(char)
+            if mask is None:
+                mask = self._glyph_mask(char)
+                cache[char] = mask
+            frame = bytearray(_BLACK_FRAME)
+            o = 0
+            for lit in mask:
+                if lit:
+                    frame[o:o + 3] = on
+                o += 3
+            frames[char] = frame
+
+        buf = self._buf
         for char in text:
-            # Get the character pattern (7x7, uses full matrix)
-            pattern = get_char_pattern(char)
-            
             # Display the character
-            for y, row in enumerate(pattern):
-                for x, ch in enumerate(row):
-                    if ch == "1":
-                        self._set_pixel(x, y, color)
-                    else:
-                        self._set_pixel(x, y, BLACK)
+            buf[:] = frames[char]
+            self._dirty = True
             self.show()
             
             # Show character for delay milliseconds
@@ -240,6 +467,15 @@ class Matrix:
             self.clear()
             _sleep_ms(100)  # Brief pause between characters
 
+    def _glyph_mask(self, char: str) -> bytes:
+        # Unpack a font bitmap to one byte per pixel, row-major
+        bitmap = get_char_bitmap(char)
+        return bytes(
+            1 if bitmap[y] & (0x40 >> x) else 0
+            for y in range(self.HEIGHT)
+            for x in range(self.WIDTH)
+        )
+
     @property
     def brightness(self) -> float:
         """
@@ -261,18 +497,39 @@ class Matrix:
         Note: For LED protection, the hardware is capped at 25% brightness.
         Setting brightness to 1.0 uses 25% hardware brightness (maximum safe level).
         """
-        self._brightness = _clamp(value)
+        self.set_brightness_silent(value)
         # Refresh hardware with new brightness
         if hasattr(self, "_np"):
             self.show()
 
+    def set_brightness_silent(self, value: float) -> None:
+        """
+        Set the brightness level (0.0 to 1.0) without redrawing.
+        
+        The new level reaches the LEDs on the next show(), so a brightness
+        change and a new frame go out as a single write.
+        
+        Args:
+            value: Brightness from 0.0 (off) to 1.0 (maximum safe brightness)
+        """
+        value = _clamp(value)
+        if value == getattr(self, "_brightness", None):
+            # Same table as before, so there's nothing to redraw
+            return
+        self._brightness = value
+        self._rebuild_lut()
+        # Every pixel's output changes with brightness
+        self._dirty = True
+
 
-def set_brightness(value: float) -> float:
+def set_brightness(value: float, show: bool = True) -> float:
     """
     Set brightness (0.0-1.0) for future matrices and update existing ones.
     
     Args:
         value: Brightness from 0.0 (off) to 1.0 (maximum safe brightness)
+        show: Redraw each matrix now; pass False to let the next frame
+              you draw carry the new brightness
     
     Returns:
         The clamped brightness value that was set
@@ -285,7 +542,9 @@ def set_brightness(value: float) -> float:
     _default_brightness = _clamp(value)
     for matrix in list(Matrix._instances):
         try:
-            matrix.brightness = _default_brightness
+            matrix.set_brightness_silent(_default_brightness)
+            if show:
+                matrix.show()
         except Exception:
             # Keep going even if a stored matrix is unavailable
             pass
@@ -314,7 +573,7 @@ def set_grid(grid_data: list) -> None:
             if len(row) != Matrix.WIDTH:
                 raise ValueError(f"Row {y} must have {Matrix.WIDTH} columns, got {len(row)}")
             for x, color in enumerate(row):
-                matrix._set_pixel(x, y, color)
+                matrix._set_pixel_unchecked(x, y, color)
         
         # Show the grid on the matrix
         matrix.show()